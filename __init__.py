@@ -34,5 +34,5 @@ def post_init_hook(cr, registry):
         
         _logger.info("Brevo Connector module initialized successfully")
     except Exception as e:
-        _logger.error(f"Error in post_init_hook: {str(e)}")
+        _logger.error("Error in post_init_hook: %s", e)
         # Don't raise the exception to avoid blocking module installation
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 {
     'name': 'Brevo Connector',
-            'version': '18.0.1.1.4',
+            'version': '18.0.1.1.5',
     'category': 'CRM',
     'summary': 'Bidirectional synchronization between Odoo and Brevo (Sendinblue)',
     'description': """
@@ -60,6 +60,7 @@ Technical Details:
                 'views/brevo_config_views.xml',
                 'views/res_partner_views.xml',
                 'views/brevo_sync_log_views.xml',
+                'views/brevo_webhook_inbox_views.xml',
                 'views/brevo_field_mapping_views.xml',
                 'wizards/brevo_config_wizard_views.xml',
                 'wizards/brevo_delete_confirmation_wizard_views.xml',
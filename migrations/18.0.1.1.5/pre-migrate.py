@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def _prepare_field_mapping_company(cr):
+    """Give company-less field mappings a company and drop duplicates before the unique constraint"""
+    cr.execute("""
+        UPDATE brevo_field_mapping
+           SET company_id = (SELECT id FROM res_company ORDER BY id LIMIT 1)
+         WHERE company_id IS NULL
+    """)
+    cr.execute("""
+        DELETE FROM brevo_field_mapping dup
+         USING brevo_field_mapping keep
+         WHERE dup.brevo_field_name = keep.brevo_field_name
+           AND dup.odoo_field_name = keep.odoo_field_name
+           AND dup.company_id = keep.company_id
+           AND dup.id > keep.id
+    """)
+    if cr.rowcount:
+        _logger.info("Removed %s duplicate Brevo field mappings", cr.rowcount)
+
+
+def _prepare_partner_dynamic_fields(cr):
+    """Clear dynamic field values that are not JSON objects, so the text to jsonb cast cannot fail"""
+    cr.execute("""
+        SELECT data_type FROM information_schema.columns
+         WHERE table_name = 'res_partner' AND column_name = 'brevo_dynamic_fields'
+    """)
+    row = cr.fetchone()
+    if not row or row[0] != 'text':
+        return
+    cr.execute("SELECT id, brevo_dynamic_fields FROM res_partner WHERE brevo_dynamic_fields IS NOT NULL")
+    invalid_ids = []
+    for partner_id, value in cr.fetchall():
+        try:
+            if isinstance(json.loads(value), dict):
+                continue
+        except ValueError:
+            pass
+        invalid_ids.append(partner_id)
+    if invalid_ids:
+        cr.execute("UPDATE res_partner SET brevo_dynamic_fields = NULL WHERE id = ANY(%s)", (invalid_ids,))
+        _logger.info("Cleared invalid Brevo dynamic fields of %s partners", len(invalid_ids))
+
+
+def migrate(cr, version):
+    if not version:
+        return
+    _prepare_field_mapping_company(cr)
+    _prepare_partner_dynamic_fields(cr)
@@ -4,7 +4,10 @@ from . import brevo_config
 from . import res_partner
 from . import res_partner_brevo_fields
 from . import brevo_sync_log
+from . import brevo_webhook_inbox
+from . import brevo_webhook_dedup
 from . import brevo_contact_list
 from . import crm_lead
 from . import brevo_field_mapping
-from . import brevo_field_discovery
\ No newline at end of file
+from . import brevo_field_discovery
+from . import ir_config_parameter
\ No newline at end of file
@@ -2,11 +2,167 @@
 
 import logging
 from datetime import datetime
-from odoo import models, fields, api, _
-from odoo.exceptions import ValidationError, UserError
+from types import MappingProxyType
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import UserError
+
+from ..services.brevo_service import get_brevo_service
+from ..services.brevo_sync_service import BrevoSyncService
 
 _logger = logging.getLogger(__name__)
 
+# Cron syncs that webhooks keep up to date in real time, with the field holding their last run.
+# With webhooks enabled they only run as a daily reconciliation.
+_WEBHOOK_COVERED_SYNCS = {
+    'action_sync_contacts': 'last_sync_contacts',
+    'action_sync_lists': 'last_sync_lists',
+}
+WEBHOOK_RECONCILE_HOURS = 24
+
+# Sync kinds run by _run_sync: (BrevoSyncService method, last-sync field or None, log label)
+_SYNC_KINDS = {
+    'contacts': ('sync_contacts', 'last_sync_contacts', 'contact'),
+    'lists': ('sync_lists', 'last_sync_lists', 'list'),
+    'tags': ('sync_tags', None, 'tag'),
+    'dynamic_fields': ('sync_dynamic_fields', None, 'dynamic fields'),
+}
+
+# Predefined Brevo attribute -> res.partner field mappings, built once at import
+_PREDEFINED_MAPPINGS = MappingProxyType({
+    'FNAME': {'odoo_field': 'firstname', 'type': 'char'},
+    'LNAME': {'odoo_field': 'lastname', 'type': 'char'},
+    'BIRTHDAY': {'odoo_field': 'date', 'type': 'date'},
+    'AGE': {'odoo_field': 'x_brevo_age', 'type': 'integer'},
+    'GENDER': {'odoo_field': 'x_brevo_gender', 'type': 'selection'},
+    'TITLE': {'odoo_field': 'title', 'type': 'many2one'},
+    'FIRSTNAME': {'odoo_field': 'firstname', 'type': 'char'},
+    'LASTNAME': {'odoo_field': 'lastname', 'type': 'char'},
+    'MIDDLENAME': {'odoo_field': 'x_brevo_middlename', 'type': 'char'},
+    'NICKNAME': {'odoo_field': 'x_brevo_nickname', 'type': 'char'},
+    'EMAIL': {'odoo_field': 'email', 'type': 'char'},
+    'SMS': {'odoo_field': 'phone', 'type': 'char'},
+    'PHONE': {'odoo_field': 'phone', 'type': 'char'},
+    'MOBILE': {'odoo_field': 'mobile', 'type': 'char'},
+    'FAX': {'odoo_field': 'x_brevo_fax', 'type': 'char'},
+    'WEBSITE': {'odoo_field': 'website', 'type': 'char'},
+    'SKYPE': {'odoo_field': 'x_brevo_skype', 'type': 'char'},
+    'LINKEDIN': {'odoo_field': 'x_brevo_linkedin', 'type': 'char'},
+    'TWITTER': {'odoo_field': 'x_brevo_twitter', 'type': 'char'},
+    'FACEBOOK': {'odoo_field': 'x_brevo_facebook', 'type': 'char'},
+    'INSTAGRAM': {'odoo_field': 'x_brevo_instagram', 'type': 'char'},
+    'YOUTUBE': {'odoo_field': 'x_brevo_youtube', 'type': 'char'},
+    'TIKTOK': {'odoo_field': 'x_brevo_tiktok', 'type': 'char'},
+    'ADDRESS': {'odoo_field': 'street', 'type': 'char'},
+    'STREET': {'odoo_field': 'street', 'type': 'char'},
+    'STREET2': {'odoo_field': 'street2', 'type': 'char'},
+    'CITY': {'odoo_field': 'city', 'type': 'char'},
+    'ZIP': {'odoo_field': 'zip', 'type': 'char'},
+    'POSTAL_CODE': {'odoo_field': 'zip', 'type': 'char'},
+    'COUNTRY': {'odoo_field': 'country_id', 'type': 'many2one'},
+    'STATE': {'odoo_field': 'state_id', 'type': 'many2one'},
+    'PROVINCE': {'odoo_field': 'state_id', 'type': 'many2one'},
+    'REGION': {'odoo_field': 'state_id', 'type': 'many2one'},
+    'TIMEZONE': {'odoo_field': 'tz', 'type': 'char'},
+    'LATITUDE': {'odoo_field': 'x_brevo_latitude', 'type': 'float'},
+    'LONGITUDE': {'odoo_field': 'x_brevo_longitude', 'type': 'float'},
+    'COMPANY': {'odoo_field': 'company_name', 'type': 'char'},
+    'COMPANY_NAME': {'odoo_field': 'company_name', 'type': 'char'},
+    'JOB_TITLE': {'odoo_field': 'function', 'type': 'char'},
+    'POSITION': {'odoo_field': 'function', 'type': 'char'},
+    'DEPARTMENT': {'odoo_field': 'x_brevo_department', 'type': 'char'},
+    'INDUSTRY': {'odoo_field': 'industry_id', 'type': 'many2one'},
+    'COMPANY_SIZE': {'odoo_field': 'x_brevo_company_size', 'type': 'integer'},
+    'ANNUAL_REVENUE': {'odoo_field': 'x_brevo_annual_revenue', 'type': 'float'},
+    'EMPLOYEES': {'odoo_field': 'x_brevo_employees', 'type': 'integer'},
+    'COMPANY_WEBSITE': {'odoo_field': 'x_brevo_company_website', 'type': 'char'},
+    'COMPANY_PHONE': {'odoo_field': 'x_brevo_company_phone', 'type': 'char'},
+    'COMPANY_EMAIL': {'odoo_field': 'x_brevo_company_email', 'type': 'char'},
+    'SOURCE': {'odoo_field': 'x_brevo_source', 'type': 'char'},
+    'LEAD_SOURCE': {'odoo_field': 'x_brevo_source', 'type': 'char'},
+    'CAMPAIGN': {'odoo_field': 'x_brevo_campaign', 'type': 'char'},
+    'UTM_SOURCE': {'odoo_field': 'x_brevo_source', 'type': 'char'},
+    'UTM_MEDIUM': {'odoo_field': 'x_brevo_utm_medium', 'type': 'char'},
+    'UTM_CAMPAIGN': {'odoo_field': 'x_brevo_utm_campaign', 'type': 'char'},
+    'UTM_TERM': {'odoo_field': 'x_brevo_utm_term', 'type': 'char'},
+    'UTM_CONTENT': {'odoo_field': 'x_brevo_utm_content', 'type': 'char'},
+    'REFERRER': {'odoo_field': 'x_brevo_referrer', 'type': 'char'},
+    'LANDING_PAGE': {'odoo_field': 'x_brevo_landing_page', 'type': 'char'},
+    'SUBSCRIBER_TYPE': {'odoo_field': 'x_brevo_subscriber_type', 'type': 'char'},
+    'SUBSCRIPTION_STATUS': {'odoo_field': 'x_brevo_subscription_status', 'type': 'selection'},
+    'OPT_IN_DATE': {'odoo_field': 'x_brevo_opt_in_date', 'type': 'date'},
+    'OPT_OUT_DATE': {'odoo_field': 'x_brevo_opt_out_date', 'type': 'date'},
+    'LAST_ACTIVITY': {'odoo_field': 'x_brevo_last_activity', 'type': 'datetime'},
+    'LAST_OPEN': {'odoo_field': 'x_brevo_last_open', 'type': 'datetime'},
+    'LAST_CLICK': {'odoo_field': 'x_brevo_last_click', 'type': 'datetime'},
+    'EMAIL_FREQUENCY': {'odoo_field': 'x_brevo_email_frequency', 'type': 'selection'},
+    'PREFERRED_LANGUAGE': {'odoo_field': 'lang', 'type': 'char'},
+    'COMMUNICATION_PREFERENCE': {'odoo_field': 'x_brevo_communication_preference', 'type': 'selection'},
+    'CUSTOM_FIELD_1': {'odoo_field': 'x_brevo_custom_field_1', 'type': 'char'},
+    'CUSTOM_FIELD_2': {'odoo_field': 'x_brevo_custom_field_2', 'type': 'char'},
+    'CUSTOM_FIELD_3': {'odoo_field': 'x_brevo_custom_field_3', 'type': 'char'},
+    'CUSTOM_FIELD_4': {'odoo_field': 'x_brevo_custom_field_4', 'type': 'char'},
+    'CUSTOM_FIELD_5': {'odoo_field': 'x_brevo_custom_field_5', 'type': 'char'},
+    'NOTES': {'odoo_field': 'comment', 'type': 'text'},
+    'TAGS': {'odoo_field': 'category_id', 'type': 'many2many'},
+    'SEGMENT': {'odoo_field': 'x_brevo_segment', 'type': 'char'},
+    'SCORE': {'odoo_field': 'x_brevo_score', 'type': 'integer'},
+    'PRIORITY': {'odoo_field': 'x_brevo_priority', 'type': 'selection'},
+    'STATUS': {'odoo_field': 'x_brevo_status', 'type': 'selection'},
+    'STAGE': {'odoo_field': 'x_brevo_stage', 'type': 'char'},
+    'TYPE': {'odoo_field': 'x_brevo_type', 'type': 'char'},
+    'CATEGORY': {'odoo_field': 'category_id', 'type': 'many2many'},
+    'RATING': {'odoo_field': 'x_brevo_rating', 'type': 'integer'},
+    'SALARY': {'odoo_field': 'x_brevo_salary', 'type': 'float'},
+    'BUDGET': {'odoo_field': 'x_brevo_budget', 'type': 'float'},
+    'INTEREST': {'odoo_field': 'x_brevo_interest', 'type': 'char'},
+    'HOBBY': {'odoo_field': 'x_brevo_hobby', 'type': 'char'},
+    'EDUCATION': {'odoo_field': 'x_brevo_education', 'type': 'char'},
+    'EXPERIENCE': {'odoo_field': 'x_brevo_experience', 'type': 'char'},
+    'SKILLS': {'odoo_field': 'x_brevo_skills', 'type': 'char'},
+    'CERTIFICATIONS': {'odoo_field': 'x_brevo_certifications', 'type': 'char'},
+    'LANGUAGES': {'odoo_field': 'x_brevo_languages', 'type': 'char'},
+    'AVAILABILITY': {'odoo_field': 'x_brevo_availability', 'type': 'char'},
+    'PREFERRED_CONTACT_TIME': {'odoo_field': 'x_brevo_preferred_contact_time', 'type': 'char'},
+    'PREFERRED_CONTACT_METHOD': {'odoo_field': 'x_brevo_preferred_contact_method', 'type': 'selection'},
+    'CONSENT_DATE': {'odoo_field': 'x_brevo_consent_date', 'type': 'date'},
+    'CONSENT_SOURCE': {'odoo_field': 'x_brevo_consent_source', 'type': 'char'},
+    'CONSENT_TEXT': {'odoo_field': 'x_brevo_consent_text', 'type': 'text'},
+    'GDPR_CONSENT': {'odoo_field': 'x_brevo_gdpr_consent', 'type': 'boolean'},
+    'MARKETING_CONSENT': {'odoo_field': 'x_brevo_marketing_consent', 'type': 'boolean'},
+    'NEWSLETTER_CONSENT': {'odoo_field': 'x_brevo_newsletter_consent', 'type': 'boolean'},
+    'SMS_CONSENT': {'odoo_field': 'x_brevo_sms_consent', 'type': 'boolean'},
+    'CALL_CONSENT': {'odoo_field': 'x_brevo_call_consent', 'type': 'boolean'},
+    'EMAIL_CONSENT': {'odoo_field': 'x_brevo_email_consent', 'type': 'boolean'},
+})
+
+# Discovery category of the predefined Brevo attributes; anything else is 'custom'
+_PREDEFINED_CATEGORIES = MappingProxyType({
+    **dict.fromkeys(('FNAME', 'LNAME', 'BIRTHDAY', 'AGE', 'GENDER', 'TITLE', 'FIRSTNAME', 'LASTNAME', 'MIDDLENAME', 'NICKNAME'), 'personal'),
+    **dict.fromkeys(('EMAIL', 'SMS', 'PHONE', 'MOBILE', 'FAX', 'WEBSITE', 'SKYPE', 'LINKEDIN', 'TWITTER', 'FACEBOOK', 'INSTAGRAM', 'YOUTUBE', 'TIKTOK'), 'contact'),
+    **dict.fromkeys(('ADDRESS', 'STREET', 'STREET2', 'CITY', 'ZIP', 'POSTAL_CODE', 'COUNTRY', 'STATE', 'PROVINCE', 'REGION', 'TIMEZONE', 'LATITUDE', 'LONGITUDE'), 'address'),
+    **dict.fromkeys(('COMPANY', 'COMPANY_NAME', 'JOB_TITLE', 'POSITION', 'DEPARTMENT', 'INDUSTRY', 'COMPANY_SIZE', 'ANNUAL_REVENUE', 'EMPLOYEES', 'COMPANY_WEBSITE', 'COMPANY_PHONE', 'COMPANY_EMAIL'), 'company'),
+    **dict.fromkeys(('SOURCE', 'LEAD_SOURCE', 'CAMPAIGN', 'UTM_SOURCE', 'UTM_MEDIUM', 'UTM_CAMPAIGN', 'UTM_TERM', 'UTM_CONTENT', 'REFERRER', 'LANDING_PAGE', 'SUBSCRIBER_TYPE', 'SUBSCRIPTION_STATUS', 'OPT_IN_DATE', 'OPT_OUT_DATE', 'LAST_ACTIVITY', 'LAST_OPEN', 'LAST_CLICK', 'EMAIL_FREQUENCY', 'PREFERRED_LANGUAGE', 'COMMUNICATION_PREFERENCE'), 'marketing'),
+})
+
+
+def _notify(title, message, kind='success'):
+    """Client action showing a notification to the user"""
+    return {
+        'type': 'ir.actions.client',
+        'tag': 'display_notification',
+        'params': {
+            'title': title,
+            'message': message,
+            'type': kind,
+        }
+    }
+
 
 class BrevoConfig(models.Model):
     """Configuration model for Brevo integration settings"""
@@ -43,12 +199,14 @@ class BrevoConfig(models.Model):
     webhooks_enabled = fields.Boolean(
         string='Enable Webhooks',
         default=True,
-        help='Enable real-time webhook updates from Brevo'
+        help='Enable real-time webhook updates from Brevo. Scheduled contact and list syncs then only '
+             'run once a day as a reconciliation; the manual sync buttons are not affected.'
     )
     
     webhook_url = fields.Char(
         string='Webhook URL',
         compute='_compute_webhook_url',
+        store=True,
         help='URL to configure in Brevo for webhook notifications'
     )
     
@@ -86,8 +244,9 @@ class BrevoConfig(models.Model):
     company_id = fields.Many2one(
         'res.company',
         string='Company',
-        default=lambda self: self.env.company,
-        required=True
+        default=lambda self: self.env.company.id,
+        required=True,
+        index=True
     )
     
     active = fields.Boolean(
@@ -96,161 +255,162 @@ class BrevoConfig(models.Model):
         help='Whether this configuration is active'
     )
 
+    _sql_constraints = [
+        ('sync_interval_range', 'CHECK(sync_interval BETWEEN 1 AND 1440)',
+         'Sync interval must be between 1 minute and 24 hours!'),
+        ('batch_size_range', 'CHECK(batch_size BETWEEN 1 AND 1000)',
+         'Batch size must be between 1 and 1000!'),
+    ]
+
     @api.depends('webhooks_enabled')
     def _compute_webhook_url(self):
         """Compute the webhook URL for Brevo configuration"""
-        base_url = self.env['ir.config_parameter'].sudo().get_param('web.base.url')
+        # Stored: recomputed when webhooks are toggled or web.base.url changes (see ir.config_parameter)
+        base_url = any(self.mapped('webhooks_enabled')) and self.env['ir.config_parameter'].sudo().get_param('web.base.url')
         for record in self:
             if record.webhooks_enabled and base_url:
                 record.webhook_url = f"{base_url}/brevo/webhook"
             else:
                 record.webhook_url = False
 
-    @api.constrains('sync_interval')
-    def _check_sync_interval(self):
-        """Validate sync interval is reasonable"""
-        for record in self:
-            if record.sync_interval < 1:
-                raise ValidationError(_('Sync interval must be at least 1 minute'))
-            if record.sync_interval > 1440:  # 24 hours
-                raise ValidationError(_('Sync interval cannot exceed 24 hours'))
-
-    @api.constrains('batch_size')
-    def _check_batch_size(self):
-        """Validate batch size is reasonable"""
-        for record in self:
-            if record.batch_size < 1:
-                raise ValidationError(_('Batch size must be at least 1'))
-            if record.batch_size > 1000:
-                raise ValidationError(_('Batch size cannot exceed 1000'))
+    def init(self):
+        # Lookup path of get_active_config: active configuration of a company
+        tools.create_index(self._cr, 'brevo_config_company_active_idx', self._table, ['company_id'], where='active')
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'active' in vals or 'company_id' in vals:
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
 
     @api.model
     def get_active_config(self):
         """Get the active configuration for the current company"""
-        return self.search([
+        return self.browse(self._get_active_config_id(self.env.company.id))
+
+    @api.model
+    @tools.ormcache('company_id')
+    def _get_active_config_id(self, company_id):
+        """Return the ID of the active configuration of a company, cached in the registry"""
+        return self.sudo().search([
             ('active', '=', True),
-            ('company_id', '=', self.env.company.id)
-        ], limit=1)
+            ('company_id', '=', company_id)
+        ], limit=1).id
+
+    def get_field_mappings_dict(self):
+        """Return the parsed field_mappings JSON of this configuration (read-only)"""
+        self.ensure_one()
+        return self._parse_field_mappings(self.field_mappings or '{}')
+
+    @api.model
+    @tools.ormcache('field_mappings')
+    def _parse_field_mappings(self, field_mappings):
+        """Parse a field_mappings JSON text, cached on its content so edits need no invalidation"""
+        try:
+            return MappingProxyType(json_loads(field_mappings))
+        except (ValueError, TypeError) as e:
+            _logger.warning("Invalid Brevo field mappings JSON: %s", e)
+            return MappingProxyType({})
 
     def test_connection(self):
         """Test the Brevo API connection"""
         try:
-            from ..services.brevo_service import BrevoService
-            service = BrevoService(self.api_key)
+            service = get_brevo_service(self.api_key)
             result = service.test_connection()
             
             if result.get('success'):
-                self.sync_status = 'success'
-                self.error_message = False
-                return {
-                    'type': 'ir.actions.client',
-                    'tag': 'display_notification',
-                    'params': {
-                        'title': _('Connection Successful'),
-                        'message': _('Successfully connected to Brevo API'),
-                        'type': 'success',
-                    }
-                }
+                self.write({
+                    'sync_status': 'success',
+                    'error_message': False,
+                })
+                return _notify(_('Connection Successful'), _('Successfully connected to Brevo API'))
             else:
-                self.sync_status = 'error'
-                self.error_message = result.get('error', 'Unknown error')
-                return {
-                    'type': 'ir.actions.client',
-                    'tag': 'display_notification',
-                    'params': {
-                        'title': _('Connection Failed'),
-                        'message': result.get('error', 'Unknown error'),
-                        'type': 'danger',
-                    }
-                }
+                self.write({
+                    'sync_status': 'error',
+                    'error_message': result.get('error', 'Unknown error'),
+                })
+                return _notify(_('Connection Failed'), result.get('error', 'Unknown error'), 'danger')
         except Exception as e:
-            _logger.error(f"Brevo connection test failed: {str(e)}")
-            self.sync_status = 'error'
-            self.error_message = str(e)
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('Connection Failed'),
-                    'message': str(e),
-                    'type': 'danger',
-                }
-            }
+            _logger.error("Brevo connection test failed: %s", e)
+            self.write({
+                'sync_status': 'error',
+                'error_message': str(e),
+            })
+            return _notify(_('Connection Failed'), str(e), 'danger')
+
+    def _rebuild_discovery(self, attributes):
+        """Sync this company's discovery records with the given Brevo attributes.
+
+        Only the delta is written: new attributes are created, vanished ones deleted and
+        changed types/categories updated, so existing rows keep their Odoo field choice.
+        """
+        Discovery = self.env['brevo.field.discovery']
+        incoming = {brevo_attr['name']: brevo_attr for brevo_attr in attributes}
+        existing = {}
+        to_unlink = Discovery
+        for record in Discovery.search([('company_id', '=', self.company_id.id)]):
+            if record.brevo_field_name in incoming and record.brevo_field_name not in existing:
+                existing[record.brevo_field_name] = record
+            else:
+                to_unlink |= record
+
+        to_create = []
+        # Changed rows grouped by their new (type, category) so each group is one UPDATE
+        to_update = {}
+        for name, brevo_attr in incoming.items():
+            type_category = (brevo_attr.get('type', ''), brevo_attr.get('category', ''))
+            record = existing.get(name)
+            if not record:
+                to_create.append({
+                    'brevo_field_name': name,
+                    'brevo_field_type': type_category[0],
+                    'brevo_field_category': type_category[1],
+                    'company_id': self.company_id.id,
+                })
+            elif (record.brevo_field_type or '', record.brevo_field_category or '') != type_category:
+                to_update[type_category] = to_update.get(type_category, Discovery) | record
+
+        with self.env.cr.savepoint():
+            to_unlink.unlink()
+            for (field_type, category), records in to_update.items():
+                records.write({'brevo_field_type': field_type, 'brevo_field_category': category})
+            Discovery.create(to_create)
+        return len(incoming)
 
     def discover_fields(self):
         """Discover available fields from Brevo and Odoo"""
         try:
             if not self.api_key:
                 raise UserError(_('Please provide a Brevo API Key'))
+            service = get_brevo_service(self.api_key)
+            discovery_count = self._rebuild_discovery(service.iter_contact_attributes())
 
-            from ..services.brevo_service import BrevoService
-            service = BrevoService(self.api_key)
-            result = service.get_all_contact_attributes()
-
-            if not result.get('success'):
-                raise UserError(_('Failed to get Brevo fields: %s') % result.get('error', 'Unknown error'))
-
-            # Get Odoo partner fields
-            odoo_fields = []
-            partner_model = self.env['res.partner']
-            for field_name, field_obj in partner_model._fields.items():
-                if field_obj.type in ['char', 'text', 'integer', 'float', 'boolean', 'date', 'datetime', 'selection', 'many2one', 'many2many']:
-                    odoo_fields.append({
-                        'name': field_name,
-                        'type': field_obj.type,
-                        'string': field_obj.string,
-                    })
-
-            # Clear existing discovery records for this company
-            self.env['brevo.field.discovery'].search([
-                ('company_id', '=', self.company_id.id)
-            ]).unlink()
-
-            # Create discovery records for all Brevo attributes
-            discovery_count = 0
-            for brevo_attr in result.get('attributes', []):
-                brevo_name = brevo_attr['name']
-                
-                # Create discovery record for each Brevo field
-                self.env['brevo.field.discovery'].create({
-                    'brevo_field_name': brevo_name,
-                    'brevo_field_type': brevo_attr.get('type', ''),
-                    'brevo_field_category': brevo_attr.get('category', ''),
-                    'company_id': self.company_id.id,
-                })
-                discovery_count += 1
-
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('Field Discovery Complete'),
-                    'message': _('Discovered %d field combinations') % discovery_count,
-                    'type': 'success',
-                }
-            }
+            return _notify(_('Field Discovery Complete'), _('Discovered %d field combinations') % discovery_count)
         except Exception as e:
-            _logger.error(f"Field discovery failed: {str(e)}")
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('Field Discovery Failed'),
-                    'message': str(e),
-                    'type': 'danger',
-                }
-            }
+            _logger.error("Field discovery failed: %s", e)
+            return _notify(_('Field Discovery Failed'), str(e), 'danger')
 
     def action_open_field_discovery(self):
         """Open Field Discovery window"""
         self.ensure_one()
         
         # Ensure discovery records exist for this company
-        existing_records = self.env['brevo.field.discovery'].search([
+        has_records = self.env['brevo.field.discovery'].search_count([
             ('company_id', '=', self.company_id.id)
-        ])
+        ], limit=1)
         
-        if not existing_records:
+        if not has_records:
             # Create discovery records if none exist
             self.discover_fields()
         
@@ -270,195 +430,36 @@ class BrevoConfig(models.Model):
     def create_all_brevo_fields(self):
         """Create all Brevo fields manually if discover_fields didn't work"""
         try:
-            from ..services.brevo_service import BrevoService
-            service = BrevoService(self.api_key or 'dummy')
-            result = service.get_all_contact_attributes()
-
-            if not result.get('success'):
-                raise UserError(_('Failed to get Brevo fields: %s') % result.get('error', 'Unknown error'))
-
-            # Clear existing discovery records for this company
-            self.env['brevo.field.discovery'].search([
-                ('company_id', '=', self.company_id.id)
-            ]).unlink()
-
-            # Create discovery records for all Brevo attributes
-            discovery_count = 0
-            for brevo_attr in result.get('attributes', []):
-                brevo_name = brevo_attr['name']
-                
-                # Create discovery record for each Brevo field
-                self.env['brevo.field.discovery'].create({
-                    'brevo_field_name': brevo_name,
-                    'brevo_field_type': brevo_attr.get('type', ''),
-                    'brevo_field_category': brevo_attr.get('category', ''),
-                    'company_id': self.company_id.id,
-                })
-                discovery_count += 1
-
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('All Brevo Fields Created'),
-                    'message': _('Created %d Brevo field discovery records') % discovery_count,
-                    'type': 'success',
-                }
-            }
+            service = get_brevo_service(self.api_key or 'dummy')
+            discovery_count = self._rebuild_discovery(service.iter_contact_attributes())
+
+            return _notify(_('All Brevo Fields Created'), _('Created %d Brevo field discovery records') % discovery_count)
         except Exception as e:
-            _logger.error(f"Failed to create all Brevo fields: {str(e)}")
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('Error'),
-                    'message': str(e),
-                    'type': 'danger',
-                }
-            }
+            _logger.error("Failed to create all Brevo fields: %s", e)
+            return _notify(_('Error'), str(e), 'danger')
 
     def create_predefined_mappings(self):
         """Create predefined field mappings based on the provided mapping list"""
         try:
-            # Predefined mappings from user's specification
-            predefined_mappings = {
-                'FNAME': {'odoo_field': 'firstname', 'type': 'char'},
-                'LNAME': {'odoo_field': 'lastname', 'type': 'char'},
-                'BIRTHDAY': {'odoo_field': 'date', 'type': 'date'},
-                'AGE': {'odoo_field': 'x_brevo_age', 'type': 'integer'},
-                'GENDER': {'odoo_field': 'x_brevo_gender', 'type': 'selection'},
-                'TITLE': {'odoo_field': 'title', 'type': 'many2one'},
-                'FIRSTNAME': {'odoo_field': 'firstname', 'type': 'char'},
-                'LASTNAME': {'odoo_field': 'lastname', 'type': 'char'},
-                'MIDDLENAME': {'odoo_field': 'x_brevo_middlename', 'type': 'char'},
-                'NICKNAME': {'odoo_field': 'x_brevo_nickname', 'type': 'char'},
-                'EMAIL': {'odoo_field': 'email', 'type': 'char'},
-                'SMS': {'odoo_field': 'phone', 'type': 'char'},
-                'PHONE': {'odoo_field': 'phone', 'type': 'char'},
-                'MOBILE': {'odoo_field': 'mobile', 'type': 'char'},
-                'FAX': {'odoo_field': 'x_brevo_fax', 'type': 'char'},
-                'WEBSITE': {'odoo_field': 'website', 'type': 'char'},
-                'SKYPE': {'odoo_field': 'x_brevo_skype', 'type': 'char'},
-                'LINKEDIN': {'odoo_field': 'x_brevo_linkedin', 'type': 'char'},
-                'TWITTER': {'odoo_field': 'x_brevo_twitter', 'type': 'char'},
-                'FACEBOOK': {'odoo_field': 'x_brevo_facebook', 'type': 'char'},
-                'INSTAGRAM': {'odoo_field': 'x_brevo_instagram', 'type': 'char'},
-                'YOUTUBE': {'odoo_field': 'x_brevo_youtube', 'type': 'char'},
-                'TIKTOK': {'odoo_field': 'x_brevo_tiktok', 'type': 'char'},
-                'ADDRESS': {'odoo_field': 'street', 'type': 'char'},
-                'STREET': {'odoo_field': 'street', 'type': 'char'},
-                'STREET2': {'odoo_field': 'street2', 'type': 'char'},
-                'CITY': {'odoo_field': 'city', 'type': 'char'},
-                'ZIP': {'odoo_field': 'zip', 'type': 'char'},
-                'POSTAL_CODE': {'odoo_field': 'zip', 'type': 'char'},
-                'COUNTRY': {'odoo_field': 'country_id', 'type': 'many2one'},
-                'STATE': {'odoo_field': 'state_id', 'type': 'many2one'},
-                'PROVINCE': {'odoo_field': 'state_id', 'type': 'many2one'},
-                'REGION': {'odoo_field': 'state_id', 'type': 'many2one'},
-                'TIMEZONE': {'odoo_field': 'tz', 'type': 'char'},
-                'LATITUDE': {'odoo_field': 'x_brevo_latitude', 'type': 'float'},
-                'LONGITUDE': {'odoo_field': 'x_brevo_longitude', 'type': 'float'},
-                'COMPANY': {'odoo_field': 'company_name', 'type': 'char'},
-                'COMPANY_NAME': {'odoo_field': 'company_name', 'type': 'char'},
-                'JOB_TITLE': {'odoo_field': 'function', 'type': 'char'},
-                'POSITION': {'odoo_field': 'function', 'type': 'char'},
-                'DEPARTMENT': {'odoo_field': 'x_brevo_department', 'type': 'char'},
-                'INDUSTRY': {'odoo_field': 'industry_id', 'type': 'many2one'},
-                'COMPANY_SIZE': {'odoo_field': 'x_brevo_company_size', 'type': 'integer'},
-                'ANNUAL_REVENUE': {'odoo_field': 'x_brevo_annual_revenue', 'type': 'float'},
-                'EMPLOYEES': {'odoo_field': 'x_brevo_employees', 'type': 'integer'},
-                'COMPANY_WEBSITE': {'odoo_field': 'x_brevo_company_website', 'type': 'char'},
-                'COMPANY_PHONE': {'odoo_field': 'x_brevo_company_phone', 'type': 'char'},
-                'COMPANY_EMAIL': {'odoo_field': 'x_brevo_company_email', 'type': 'char'},
-                'SOURCE': {'odoo_field': 'x_brevo_source', 'type': 'char'},
-                'LEAD_SOURCE': {'odoo_field': 'x_brevo_source', 'type': 'char'},
-                'CAMPAIGN': {'odoo_field': 'x_brevo_campaign', 'type': 'char'},
-                'UTM_SOURCE': {'odoo_field': 'x_brevo_source', 'type': 'char'},
-                'UTM_MEDIUM': {'odoo_field': 'x_brevo_utm_medium', 'type': 'char'},
-                'UTM_CAMPAIGN': {'odoo_field': 'x_brevo_utm_campaign', 'type': 'char'},
-                'UTM_TERM': {'odoo_field': 'x_brevo_utm_term', 'type': 'char'},
-                'UTM_CONTENT': {'odoo_field': 'x_brevo_utm_content', 'type': 'char'},
-                'REFERRER': {'odoo_field': 'x_brevo_referrer', 'type': 'char'},
-                'LANDING_PAGE': {'odoo_field': 'x_brevo_landing_page', 'type': 'char'},
-                'SUBSCRIBER_TYPE': {'odoo_field': 'x_brevo_subscriber_type', 'type': 'char'},
-                'SUBSCRIPTION_STATUS': {'odoo_field': 'x_brevo_subscription_status', 'type': 'selection'},
-                'OPT_IN_DATE': {'odoo_field': 'x_brevo_opt_in_date', 'type': 'date'},
-                'OPT_OUT_DATE': {'odoo_field': 'x_brevo_opt_out_date', 'type': 'date'},
-                'LAST_ACTIVITY': {'odoo_field': 'x_brevo_last_activity', 'type': 'datetime'},
-                'LAST_OPEN': {'odoo_field': 'x_brevo_last_open', 'type': 'datetime'},
-                'LAST_CLICK': {'odoo_field': 'x_brevo_last_click', 'type': 'datetime'},
-                'EMAIL_FREQUENCY': {'odoo_field': 'x_brevo_email_frequency', 'type': 'selection'},
-                'PREFERRED_LANGUAGE': {'odoo_field': 'lang', 'type': 'char'},
-                'COMMUNICATION_PREFERENCE': {'odoo_field': 'x_brevo_communication_preference', 'type': 'selection'},
-                'CUSTOM_FIELD_1': {'odoo_field': 'x_brevo_custom_field_1', 'type': 'char'},
-                'CUSTOM_FIELD_2': {'odoo_field': 'x_brevo_custom_field_2', 'type': 'char'},
-                'CUSTOM_FIELD_3': {'odoo_field': 'x_brevo_custom_field_3', 'type': 'char'},
-                'CUSTOM_FIELD_4': {'odoo_field': 'x_brevo_custom_field_4', 'type': 'char'},
-                'CUSTOM_FIELD_5': {'odoo_field': 'x_brevo_custom_field_5', 'type': 'char'},
-                'NOTES': {'odoo_field': 'comment', 'type': 'text'},
-                'TAGS': {'odoo_field': 'category_id', 'type': 'many2many'},
-                'SEGMENT': {'odoo_field': 'x_brevo_segment', 'type': 'char'},
-                'SCORE': {'odoo_field': 'x_brevo_score', 'type': 'integer'},
-                'PRIORITY': {'odoo_field': 'x_brevo_priority', 'type': 'selection'},
-                'STATUS': {'odoo_field': 'x_brevo_status', 'type': 'selection'},
-                'STAGE': {'odoo_field': 'x_brevo_stage', 'type': 'char'},
-                'TYPE': {'odoo_field': 'x_brevo_type', 'type': 'char'},
-                'CATEGORY': {'odoo_field': 'category_id', 'type': 'many2many'},
-                'RATING': {'odoo_field': 'x_brevo_rating', 'type': 'integer'},
-                'SALARY': {'odoo_field': 'x_brevo_salary', 'type': 'float'},
-                'BUDGET': {'odoo_field': 'x_brevo_budget', 'type': 'float'},
-                'INTEREST': {'odoo_field': 'x_brevo_interest', 'type': 'char'},
-                'HOBBY': {'odoo_field': 'x_brevo_hobby', 'type': 'char'},
-                'EDUCATION': {'odoo_field': 'x_brevo_education', 'type': 'char'},
-                'EXPERIENCE': {'odoo_field': 'x_brevo_experience', 'type': 'char'},
-                'SKILLS': {'odoo_field': 'x_brevo_skills', 'type': 'char'},
-                'CERTIFICATIONS': {'odoo_field': 'x_brevo_certifications', 'type': 'char'},
-                'LANGUAGES': {'odoo_field': 'x_brevo_languages', 'type': 'char'},
-                'AVAILABILITY': {'odoo_field': 'x_brevo_availability', 'type': 'char'},
-                'PREFERRED_CONTACT_TIME': {'odoo_field': 'x_brevo_preferred_contact_time', 'type': 'char'},
-                'PREFERRED_CONTACT_METHOD': {'odoo_field': 'x_brevo_preferred_contact_method', 'type': 'selection'},
-                'CONSENT_DATE': {'odoo_field': 'x_brevo_consent_date', 'type': 'date'},
-                'CONSENT_SOURCE': {'odoo_field': 'x_brevo_consent_source', 'type': 'char'},
-                'CONSENT_TEXT': {'odoo_field': 'x_brevo_consent_text', 'type': 'text'},
-                'GDPR_CONSENT': {'odoo_field': 'x_brevo_gdpr_consent', 'type': 'boolean'},
-                'MARKETING_CONSENT': {'odoo_field': 'x_brevo_marketing_consent', 'type': 'boolean'},
-                'NEWSLETTER_CONSENT': {'odoo_field': 'x_brevo_newsletter_consent', 'type': 'boolean'},
-                'SMS_CONSENT': {'odoo_field': 'x_brevo_sms_consent', 'type': 'boolean'},
-                'CALL_CONSENT': {'odoo_field': 'x_brevo_call_consent', 'type': 'boolean'},
-                'EMAIL_CONSENT': {'odoo_field': 'x_brevo_email_consent', 'type': 'boolean'},
-            }
-
-            # Clear existing discovery records for this company
-            self.env['brevo.field.discovery'].search([
-                ('company_id', '=', self.company_id.id)
-            ]).unlink()
+            Discovery = self.env['brevo.field.discovery']
+            Mapping = self.env['brevo.field.mapping']
+            partner_fields = self.env['res.partner']._fields
 
             # Create discovery records with predefined mappings
-            discovery_count = 0
-            for brevo_name, mapping_info in predefined_mappings.items():
-                # Determine category based on field name
-                category = 'custom'
-                if brevo_name in ['FNAME', 'LNAME', 'BIRTHDAY', 'AGE', 'GENDER', 'TITLE', 'FIRSTNAME', 'LASTNAME', 'MIDDLENAME', 'NICKNAME']:
-                    category = 'personal'
-                elif brevo_name in ['EMAIL', 'SMS', 'PHONE', 'MOBILE', 'FAX', 'WEBSITE', 'SKYPE', 'LINKEDIN', 'TWITTER', 'FACEBOOK', 'INSTAGRAM', 'YOUTUBE', 'TIKTOK']:
-                    category = 'contact'
-                elif brevo_name in ['ADDRESS', 'STREET', 'STREET2', 'CITY', 'ZIP', 'POSTAL_CODE', 'COUNTRY', 'STATE', 'PROVINCE', 'REGION', 'TIMEZONE', 'LATITUDE', 'LONGITUDE']:
-                    category = 'address'
-                elif brevo_name in ['COMPANY', 'COMPANY_NAME', 'JOB_TITLE', 'POSITION', 'DEPARTMENT', 'INDUSTRY', 'COMPANY_SIZE', 'ANNUAL_REVENUE', 'EMPLOYEES', 'COMPANY_WEBSITE', 'COMPANY_PHONE', 'COMPANY_EMAIL']:
-                    category = 'company'
-                elif brevo_name in ['SOURCE', 'LEAD_SOURCE', 'CAMPAIGN', 'UTM_SOURCE', 'UTM_MEDIUM', 'UTM_CAMPAIGN', 'UTM_TERM', 'UTM_CONTENT', 'REFERRER', 'LANDING_PAGE', 'SUBSCRIBER_TYPE', 'SUBSCRIPTION_STATUS', 'OPT_IN_DATE', 'OPT_OUT_DATE', 'LAST_ACTIVITY', 'LAST_OPEN', 'LAST_CLICK', 'EMAIL_FREQUENCY', 'PREFERRED_LANGUAGE', 'COMMUNICATION_PREFERENCE']:
-                    category = 'marketing'
+            discovery_vals = []
+            mapping_vals = []
+            for brevo_name, mapping_info in _PREDEFINED_MAPPINGS.items():
+                category = _PREDEFINED_CATEGORIES.get(brevo_name, 'custom')
 
                 # Get Odoo field info
-                odoo_field = self.env['res.partner']._fields.get(mapping_info['odoo_field'])
+                odoo_field = partner_fields.get(mapping_info['odoo_field'])
                 odoo_field_type = mapping_info['type']
                 odoo_field_string = ''
                 if odoo_field:
                     odoo_field_type = odoo_field.type
                     odoo_field_string = odoo_field.string
 
-                # Create discovery record
-                discovery_record = self.env['brevo.field.discovery'].create({
+                discovery_vals.append({
                     'brevo_field_name': brevo_name,
                     'odoo_field_name': mapping_info['odoo_field'],
                     'brevo_field_type': mapping_info['type'],
@@ -469,203 +470,145 @@ class BrevoConfig(models.Model):
                 })
                 
                 # Create mapping if odoo field exists
-                odoo_field = self.env['res.partner']._fields.get(mapping_info['odoo_field'])
                 if odoo_field:
-                    self.env['brevo.field.mapping'].create({
+                    mapping_vals.append({
                         'name': f'{brevo_name} -> {mapping_info["odoo_field"]}',
                         'brevo_field_name': brevo_name,
                         'odoo_field_name': mapping_info['odoo_field'],
                         'field_type': mapping_info['type'],
                         'company_id': self.company_id.id,
                     })
-                
-                discovery_count += 1
-
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('Predefined Mappings Created'),
-                    'message': _('Created %d predefined field mappings') % discovery_count,
-                    'type': 'success',
-                }
+
+            # Keep the mappings the company already has; re-running must not duplicate them
+            existing = {
+                (mapping.brevo_field_name, mapping.odoo_field_name)
+                for mapping in Mapping.with_context(active_test=False).search([('company_id', '=', self.company_id.id)])
             }
+            mapping_vals = [
+                vals for vals in mapping_vals if (vals['brevo_field_name'], vals['odoo_field_name']) not in existing
+            ]
+
+            # Replace the company's discovery records atomically: on failure the previous ones are kept
+            with self.env.cr.savepoint():
+                Discovery._clear_company_records(self.company_id.id)
+                Discovery.create(discovery_vals)
+                Mapping.create(mapping_vals)
+            discovery_count = len(discovery_vals)
+
+            return _notify(_('Predefined Mappings Created'), _('Created %d predefined field mappings') % discovery_count)
         except Exception as e:
-            _logger.error(f"Failed to create predefined mappings: {str(e)}")
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('Error'),
-                    'message': str(e),
-                    'type': 'danger',
-                }
-            }
+            _logger.error("Failed to create predefined mappings: %s", e)
+            return _notify(_('Error'), str(e), 'danger')
 
     def manual_sync_contacts(self):
         """Trigger manual synchronization of contacts"""
         try:
-            self.sync_status = 'syncing'
-            self.error_message = False
-            
-            from ..services.brevo_sync_service import BrevoSyncService
             sync_service = BrevoSyncService(self)
             result = sync_service.sync_contacts()
             
             if result.get('success'):
-                self.sync_status = 'success'
-                self.last_sync_contacts = fields.Datetime.now()
-                return {
-                    'type': 'ir.actions.client',
-                    'tag': 'display_notification',
-                    'params': {
-                        'title': _('Sync Successful'),
-                        'message': _('Contacts synchronized successfully'),
-                        'type': 'success',
-                    }
-                }
+                self.write({
+                    'sync_status': 'success',
+                    'error_message': False,
+                    'last_sync_contacts': fields.Datetime.now(),
+                })
+                return _notify(_('Sync Successful'), _('Contacts synchronized successfully'))
             else:
-                self.sync_status = 'error'
-                self.error_message = result.get('error', 'Unknown error')
-                return {
-                    'type': 'ir.actions.client',
-                    'tag': 'display_notification',
-                    'params': {
-                        'title': _('Sync Failed'),
-                        'message': result.get('error', 'Unknown error'),
-                        'type': 'danger',
-                    }
-                }
+                self.write({
+                    'sync_status': 'error',
+                    'error_message': result.get('error', 'Unknown error'),
+                })
+                return _notify(_('Sync Failed'), result.get('error', 'Unknown error'), 'danger')
         except Exception as e:
-            _logger.error(f"Manual contact sync failed: {str(e)}")
-            self.sync_status = 'error'
-            self.error_message = str(e)
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('Sync Failed'),
-                    'message': str(e),
-                    'type': 'danger',
-                }
-            }
+            _logger.error("Manual contact sync failed: %s", e)
+            self.write({
+                'sync_status': 'error',
+                'error_message': str(e),
+            })
+            return _notify(_('Sync Failed'), str(e), 'danger')
 
     def manual_sync_lists(self):
         """Trigger manual synchronization of contact lists"""
         try:
-            self.sync_status = 'syncing'
-            self.error_message = False
-            
-            from ..services.brevo_sync_service import BrevoSyncService
             sync_service = BrevoSyncService(self)
             result = sync_service.sync_lists()
             
             if result.get('success'):
-                self.sync_status = 'success'
-                self.last_sync_lists = fields.Datetime.now()
-                return {
-                    'type': 'ir.actions.client',
-                    'tag': 'display_notification',
-                    'params': {
-                        'title': _('Sync Successful'),
-                        'message': _('Contact lists synchronized successfully'),
-                        'type': 'success',
-                    }
-                }
+                self.write({
+                    'sync_status': 'success',
+                    'error_message': False,
+                    'last_sync_lists': fields.Datetime.now(),
+                })
+                return _notify(_('Sync Successful'), _('Contact lists synchronized successfully'))
             else:
-                self.sync_status = 'error'
-                self.error_message = result.get('error', 'Unknown error')
-                return {
-                    'type': 'ir.actions.client',
-                    'tag': 'display_notification',
-                    'params': {
-                        'title': _('Sync Failed'),
-                        'message': result.get('error', 'Unknown error'),
-                        'type': 'danger',
-                    }
-                }
+                self.write({
+                    'sync_status': 'error',
+                    'error_message': result.get('error', 'Unknown error'),
+                })
+                return _notify(_('Sync Failed'), result.get('error', 'Unknown error'), 'danger')
         except Exception as e:
-            _logger.error(f"Manual lists sync failed: {str(e)}")
-            self.sync_status = 'error'
-            self.error_message = str(e)
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': _('Sync Failed'),
-                    'message': str(e),
-                    'type': 'danger',
-                }
+            _logger.error("Manual lists sync failed: %s", e)
+            self.write({
+                'sync_status': 'error',
+                'error_message': str(e),
+            })
+            return _notify(_('Sync Failed'), str(e), 'danger')
+
+    @api.model
+    def _cron_sync(self, method_name):
+        """Run a sync action for every active configuration, each in its own transaction"""
+        configs = self.search([('active', '=', True), ('api_key', '!=', False)])
+        last_sync_field = _WEBHOOK_COVERED_SYNCS.get(method_name)
+        if last_sync_field:
+            cutoff = fields.Datetime.subtract(fields.Datetime.now(), hours=WEBHOOK_RECONCILE_HOURS)
+            configs = configs.filtered(
+                lambda c: not (c.webhooks_enabled and c[last_sync_field] and c[last_sync_field] > cutoff)
+            )
+        for index, config in enumerate(configs, start=1):
+            # _run_sync records a failing configuration's error itself, so the others still run
+            getattr(config, method_name)()
+            self.env['ir.cron']._notify_progress(done=index, remaining=len(configs) - index)
+            # Commit per configuration: a slow Brevo account neither holds locks for the whole
+            # run nor loses the work already done for the others
+            self.env.cr.commit()
+
+    def _run_sync(self, kind):
+        """Run one kind of Brevo sync for each configuration and record the outcomes"""
+        service_method, last_sync_field, label = _SYNC_KINDS[kind]
+        # Configurations grouped by outcome (False on success, else the error) for one write per group
+        outcomes = {}
+        # Nothing to talk to Brevo with: leave archived or key-less configurations untouched
+        for config in self.filtered(lambda c: c.active and c.api_key):
+            try:
+                result = getattr(BrevoSyncService(config), service_method)()
+                error = False if result.get('success') else result.get('error', 'Unknown error')
+            except Exception as e:
+                _logger.error("Brevo %s sync cron failed for config %s: %s", label, config.id, e)
+                error = str(e)
+            outcomes[error] = outcomes.get(error, self.browse()) | config
+
+        now = fields.Datetime.now()
+        for error, configs in outcomes.items():
+            vals = {
+                'sync_status': 'error' if error else 'success',
+                'error_message': error,
             }
+            if not error and last_sync_field:
+                vals[last_sync_field] = now
+            configs.write(vals)
 
     def action_sync_contacts(self):
         """Method for cron job to sync contacts"""
-        try:
-            from ..services.brevo_sync_service import BrevoSyncService
-            sync_service = BrevoSyncService(self)
-            result = sync_service.sync_contacts()
-            
-            if result.get('success'):
-                self.sync_status = 'success'
-                self.error_message = False
-            else:
-                self.sync_status = 'error'
-                self.error_message = result.get('error', 'Unknown error')
-        except Exception as e:
-            _logger.error(f"Brevo contact sync cron failed for config {self.id}: {str(e)}")
-            self.sync_status = 'error'
-            self.error_message = str(e)
+        return self._run_sync('contacts')
 
     def action_sync_lists(self):
         """Method for cron job to sync lists"""
-        try:
-            from ..services.brevo_sync_service import BrevoSyncService
-            sync_service = BrevoSyncService(self)
-            result = sync_service.sync_lists()
-            
-            if result.get('success'):
-                self.sync_status = 'success'
-                self.error_message = False
-            else:
-                self.sync_status = 'error'
-                self.error_message = result.get('error', 'Unknown error')
-        except Exception as e:
-            _logger.error(f"Brevo list sync cron failed for config {self.id}: {str(e)}")
-            self.sync_status = 'error'
-            self.error_message = str(e)
+        return self._run_sync('lists')
 
     def action_sync_tags(self):
         """Method for cron job to sync tags"""
-        try:
-            from ..services.brevo_sync_service import BrevoSyncService
-            sync_service = BrevoSyncService(self)
-            result = sync_service.sync_tags()
-            
-            if result.get('success'):
-                self.sync_status = 'success'
-                self.error_message = False
-            else:
-                self.sync_status = 'error'
-                self.error_message = result.get('error', 'Unknown error')
-        except Exception as e:
-            _logger.error(f"Brevo tag sync cron failed for config {self.id}: {str(e)}")
-            self.sync_status = 'error'
-            self.error_message = str(e)
+        return self._run_sync('tags')
 
     def action_sync_dynamic_fields(self):
         """Method for cron job to sync dynamic fields"""
-        try:
-            from ..services.brevo_sync_service import BrevoSyncService
-            sync_service = BrevoSyncService(self)
-            result = sync_service.sync_dynamic_fields()
-            
-            if result.get('success'):
-                self.sync_status = 'success'
-                self.error_message = False
-            else:
-                self.sync_status = 'error'
-                self.error_message = result.get('error', 'Unknown error')
-        except Exception as e:
-            _logger.error(f"Brevo dynamic fields sync cron failed for config {self.id}: {str(e)}")
-            self.sync_status = 'error'
-            self.error_message = str(e)
+        return self._run_sync('dynamic_fields')
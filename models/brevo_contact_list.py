@@ -3,9 +3,11 @@
 import logging
 import json
 from datetime import datetime
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError
 
+from ..services.brevo_sync_service import BrevoSyncService, parse_brevo_datetime
+
 _logger = logging.getLogger(__name__)
 
 
@@ -24,8 +26,7 @@ class BrevoContactList(models.Model):
     brevo_id = fields.Char(
         string='Brevo List ID',
         required=True,
-        help='Unique identifier for this list in Brevo',
-        index=True
+        help='Unique identifier for this list in Brevo'
     )
     
     description = fields.Text(
@@ -60,15 +61,6 @@ class BrevoContactList(models.Model):
         help='Odoo partner category mapped to this Brevo list'
     )
     
-    partner_category_ids = fields.Many2many(
-        'res.partner.category',
-        'brevo_list_category_rel',
-        'list_id',
-        'category_id',
-        string='Partner Categories',
-        help='Odoo partner categories mapped to this Brevo list'
-    )
-    
     # Sync information
     sync_status = fields.Selection([
         ('pending', 'Pending'),
@@ -102,7 +94,7 @@ class BrevoContactList(models.Model):
     company_id = fields.Many2one(
         'res.company',
         string='Company',
-        default=lambda self: self.env.company,
+        default=lambda self: self.env.company.id,
         required=True
     )
     
@@ -117,20 +109,25 @@ class BrevoContactList(models.Model):
          'Brevo List ID must be unique per company!'),
     ]
 
+    def init(self):
+        # Lists pending synchronization per company (get_lists_for_brevo_sync)
+        tools.create_index(self._cr, 'brevo_contact_list_sync_idx', self._table, ['company_id', 'active', 'sync_status'])
+
     @api.model
     def create_from_brevo_data(self, brevo_data, company_id=None):
         """Create a new contact list from Brevo data"""
         try:
             company_id = company_id or self.env.company.id
             
-            # Check if list already exists
-            existing_list = self.search([
-                ('brevo_id', '=', str(brevo_data.get('id'))),
-                ('company_id', '=', company_id)
-            ], limit=1)
-            
-            if existing_list:
-                return existing_list
+            # Check if list already exists, without loading the record
+            self.flush_model(['brevo_id', 'company_id'])
+            self.env.cr.execute(
+                "SELECT id FROM brevo_contact_list WHERE brevo_id = %s AND company_id = %s LIMIT 1",
+                (str(brevo_data.get('id')), company_id)
+            )
+            row = self.env.cr.fetchone()
+            if row:
+                return self.browse(row[0])
             
             # Create new list
             list_vals = {
@@ -151,9 +148,83 @@ class BrevoContactList(models.Model):
             return self.create(list_vals)
             
         except Exception as e:
-            _logger.error(f"Failed to create contact list from Brevo data: {str(e)}")
+            _logger.error("Failed to create contact list from Brevo data: %s", e)
             raise ValidationError(_('Failed to create contact list from Brevo data: %s') % str(e))
 
+    @api.model
+    def _brevo_payload_to_vals(self, brevo_data, category_ids):
+        """Values of a list from a Brevo list payload; category_ids maps list names to categories"""
+        return {
+            'name': brevo_data['name'],
+            'partner_category_id': category_ids[brevo_data['name']],
+            'unique_subscribers': brevo_data.get('uniqueSubscribers', 0),
+            'total_blacklisted': brevo_data.get('totalBlacklisted', 0),
+            'total_unsubscribers': brevo_data.get('totalUnsubscribers', 0),
+            'description': brevo_data.get('description', ''),
+            'folder_id': str(brevo_data.get('folderId', '')),
+            'updated_at': parse_brevo_datetime(brevo_data.get('updatedAt')),
+        }
+
+    @api.model
+    def _get_partner_categories(self, names):
+        """Return {name: category id} for the given names, creating the missing categories in one batch"""
+        Category = self.env['res.partner.category']
+        category_ids = {}
+        for category in Category.search([('name', 'in', list(names))]):
+            category_ids.setdefault(category.name, category.id)
+        missing = [name for name in dict.fromkeys(names) if name not in category_ids]
+        for category in Category.create([{'name': name} for name in missing]):
+            category_ids[category.name] = category.id
+        return category_ids
+
+    @api.model
+    def bulk_update_from_brevo_data(self, payloads, company_id=None):
+        """Update the company's lists matching Brevo list payloads"""
+        company_id = company_id or self.env.company.id
+        by_brevo_id = {str(payload['id']): payload for payload in payloads}
+        records = self.search([
+            ('brevo_id', 'in', list(by_brevo_id)),
+            ('company_id', '=', company_id)
+        ])
+        category_ids = self._get_partner_categories([by_brevo_id[record.brevo_id]['name'] for record in records])
+
+        # Payload fields differ per list; the sync bookkeeping is shared and written once
+        for record in records:
+            record.write(self._brevo_payload_to_vals(by_brevo_id[record.brevo_id], category_ids))
+        records.write({
+            'sync_status': 'synced',
+            'last_sync': fields.Datetime.now(),
+        })
+        return records
+
+    @api.model
+    def create_many_from_brevo_data(self, payloads, company_id=None, existing_ids=None):
+        """Create the lists of Brevo list payloads the company does not have yet, in one batch.
+
+        existing_ids are the Brevo IDs the company already has, when the caller knows them.
+        """
+        company_id = company_id or self.env.company.id
+        by_brevo_id = {str(payload['id']): payload for payload in payloads}
+        if existing_ids is None:
+            existing_ids = set(self.search([
+                ('brevo_id', 'in', list(by_brevo_id)),
+                ('company_id', '=', company_id)
+            ]).mapped('brevo_id'))
+        new_payloads = [payload for brevo_id, payload in by_brevo_id.items() if brevo_id not in existing_ids]
+        category_ids = self._get_partner_categories([payload['name'] for payload in new_payloads])
+        now = fields.Datetime.now()
+        return self.create([
+            dict(
+                self._brevo_payload_to_vals(payload, category_ids),
+                sync_status='synced',
+                last_sync=now,
+                brevo_id=str(payload['id']),
+                created_at=parse_brevo_datetime(payload.get('createdAt')),
+                company_id=company_id,
+            )
+            for payload in new_payloads
+        ])
+
     def update_from_brevo_data(self, brevo_data):
         """Update this list with data from Brevo"""
         try:
@@ -173,14 +244,15 @@ class BrevoContactList(models.Model):
             self.write(update_vals)
             
         except Exception as e:
-            _logger.error(f"Failed to update contact list from Brevo data: {str(e)}")
-            self.sync_status = 'error'
-            self.sync_error = str(e)
+            _logger.error("Failed to update contact list from Brevo data: %s", e)
+            self.write({
+                'sync_status': 'error',
+                'sync_error': str(e),
+            })
 
     def sync_to_brevo(self):
         """Manually sync this list to Brevo"""
         try:
-            from ..services.brevo_sync_service import BrevoSyncService
             config = self.env['brevo.config'].get_active_config()
             
             if not config:
@@ -190,9 +262,11 @@ class BrevoContactList(models.Model):
             result = sync_service.sync_list_to_brevo(self)
             
             if result.get('success'):
-                self.sync_status = 'synced'
-                self.last_sync = fields.Datetime.now()
-                self.sync_error = False
+                self.write({
+                    'sync_status': 'synced',
+                    'last_sync': fields.Datetime.now(),
+                    'sync_error': False,
+                })
                 
                 return {
                     'type': 'ir.actions.client',
@@ -204,8 +278,10 @@ class BrevoContactList(models.Model):
                     }
                 }
             else:
-                self.sync_status = 'error'
-                self.sync_error = result.get('error', 'Unknown error')
+                self.write({
+                    'sync_status': 'error',
+                    'sync_error': result.get('error', 'Unknown error'),
+                })
                 
                 return {
                     'type': 'ir.actions.client',
@@ -217,9 +293,11 @@ class BrevoContactList(models.Model):
                     }
                 }
         except Exception as e:
-            _logger.error(f"Contact list sync to Brevo failed: {str(e)}")
-            self.sync_status = 'error'
-            self.sync_error = str(e)
+            _logger.error("Contact list sync to Brevo failed: %s", e)
+            self.write({
+                'sync_status': 'error',
+                'sync_error': str(e),
+            })
             
             return {
                 'type': 'ir.actions.client',
@@ -252,7 +330,6 @@ class BrevoContactList(models.Model):
     def sync_memberships(self):
         """Sync list memberships with Brevo"""
         try:
-            from ..services.brevo_sync_service import BrevoSyncService
             config = self.env['brevo.config'].get_active_config()
             
             if not config:
@@ -282,7 +359,7 @@ class BrevoContactList(models.Model):
                     }
                 }
         except Exception as e:
-            _logger.error(f"List memberships sync failed: {str(e)}")
+            _logger.error("List memberships sync failed: %s", e)
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
@@ -1,11 +1,131 @@
 # -*- coding: utf-8 -*-
 
 import logging
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError
 
 _logger = logging.getLogger(__name__)
 
+# Odoo field types that brevo.field.mapping supports directly
+_MAPPABLE_FIELD_TYPES = frozenset((
+    'char', 'text', 'integer', 'float', 'boolean', 'date', 'datetime', 'selection', 'many2one', 'many2many',
+))
+
+# Standard Odoo partner fields offered for mapping
+_STANDARD_PARTNER_FIELDS = (
+    ('name', 'Name'),
+    ('email', 'Email'),
+    ('phone', 'Phone'),
+    ('mobile', 'Mobile'),
+    ('street', 'Street'),
+    ('street2', 'Street2'),
+    ('city', 'City'),
+    ('zip', 'ZIP'),
+    ('website', 'Website'),
+    ('comment', 'Notes'),
+    ('title', 'Title'),
+    ('function', 'Job Position'),
+    ('parent_id', 'Company'),
+    ('country_id', 'Country'),
+    ('state_id', 'State'),
+    ('category_id', 'Tags'),
+    ('is_company', 'Is Company'),
+    ('customer_rank', 'Customer Rank'),
+    ('supplier_rank', 'Supplier Rank'),
+    ('lang', 'Language'),
+    ('tz', 'Timezone'),
+    ('date', 'Date of Birth'),
+    ('industry_id', 'Industry'),
+    ('company_name', 'Company Name'),
+    ('company_type', 'Company Type'),
+    ('user_id', 'Salesperson'),
+    ('team_id', 'Sales Team'),
+    ('ref', 'Reference'),
+    ('barcode', 'Barcode'),
+    ('active', 'Active'),
+)
+
+# Brevo custom partner fields offered for mapping, when installed
+_BREVO_PARTNER_FIELDS = (
+    ('x_brevo_age', 'Brevo Age'),
+    ('x_brevo_gender', 'Brevo Gender'),
+    ('x_brevo_middlename', 'Brevo Middle Name'),
+    ('x_brevo_nickname', 'Brevo Nickname'),
+    ('x_brevo_fax', 'Brevo Fax'),
+    ('x_brevo_skype', 'Brevo Skype'),
+    ('x_brevo_linkedin', 'Brevo LinkedIn'),
+    ('x_brevo_twitter', 'Brevo Twitter'),
+    ('x_brevo_facebook', 'Brevo Facebook'),
+    ('x_brevo_instagram', 'Brevo Instagram'),
+    ('x_brevo_youtube', 'Brevo YouTube'),
+    ('x_brevo_tiktok', 'Brevo TikTok'),
+    ('x_brevo_latitude', 'Brevo Latitude'),
+    ('x_brevo_longitude', 'Brevo Longitude'),
+    ('x_brevo_department', 'Brevo Department'),
+    ('x_brevo_company_size', 'Brevo Company Size'),
+    ('x_brevo_annual_revenue', 'Brevo Annual Revenue'),
+    ('x_brevo_employees', 'Brevo Employees'),
+    ('x_brevo_company_website', 'Brevo Company Website'),
+    ('x_brevo_company_phone', 'Brevo Company Phone'),
+    ('x_brevo_company_email', 'Brevo Company Email'),
+    ('x_brevo_source', 'Brevo Source'),
+    ('x_brevo_campaign', 'Brevo Campaign'),
+    ('x_brevo_utm_medium', 'Brevo UTM Medium'),
+    ('x_brevo_utm_campaign', 'Brevo UTM Campaign'),
+    ('x_brevo_utm_term', 'Brevo UTM Term'),
+    ('x_brevo_utm_content', 'Brevo UTM Content'),
+    ('x_brevo_referrer', 'Brevo Referrer'),
+    ('x_brevo_landing_page', 'Brevo Landing Page'),
+    ('x_brevo_subscriber_type', 'Brevo Subscriber Type'),
+    ('x_brevo_subscription_status', 'Brevo Subscription Status'),
+    ('x_brevo_opt_in_date', 'Brevo Opt-in Date'),
+    ('x_brevo_opt_out_date', 'Brevo Opt-out Date'),
+    ('x_brevo_last_activity', 'Brevo Last Activity'),
+    ('x_brevo_last_open', 'Brevo Last Open'),
+    ('x_brevo_last_click', 'Brevo Last Click'),
+    ('x_brevo_email_frequency', 'Brevo Email Frequency'),
+    ('x_brevo_communication_preference', 'Brevo Communication Preference'),
+    ('x_brevo_custom_field_1', 'Brevo Custom Field 1'),
+    ('x_brevo_custom_field_2', 'Brevo Custom Field 2'),
+    ('x_brevo_custom_field_3', 'Brevo Custom Field 3'),
+    ('x_brevo_custom_field_4', 'Brevo Custom Field 4'),
+    ('x_brevo_custom_field_5', 'Brevo Custom Field 5'),
+    ('x_brevo_segment', 'Brevo Segment'),
+    ('x_brevo_score', 'Brevo Score'),
+    ('x_brevo_priority', 'Brevo Priority'),
+    ('x_brevo_status', 'Brevo Status'),
+    ('x_brevo_stage', 'Brevo Stage'),
+    ('x_brevo_type', 'Brevo Type'),
+    ('x_brevo_rating', 'Brevo Rating'),
+    ('x_brevo_salary', 'Brevo Salary'),
+    ('x_brevo_budget', 'Brevo Budget'),
+    ('x_brevo_interest', 'Brevo Interest'),
+    ('x_brevo_hobby', 'Brevo Hobby'),
+    ('x_brevo_education', 'Brevo Education'),
+    ('x_brevo_experience', 'Brevo Experience'),
+    ('x_brevo_skills', 'Brevo Skills'),
+    ('x_brevo_certifications', 'Brevo Certifications'),
+    ('x_brevo_languages', 'Brevo Languages'),
+    ('x_brevo_availability', 'Brevo Availability'),
+    ('x_brevo_preferred_contact_time', 'Brevo Preferred Contact Time'),
+    ('x_brevo_preferred_contact_method', 'Brevo Preferred Contact Method'),
+    ('x_brevo_consent_date', 'Brevo Consent Date'),
+    ('x_brevo_consent_source', 'Brevo Consent Source'),
+    ('x_brevo_consent_text', 'Brevo Consent Text'),
+    ('x_brevo_gdpr_consent', 'Brevo GDPR Consent'),
+    ('x_brevo_marketing_consent', 'Brevo Marketing Consent'),
+    ('x_brevo_newsletter_consent', 'Brevo Newsletter Consent'),
+    ('x_brevo_sms_consent', 'Brevo SMS Consent'),
+    ('x_brevo_call_consent', 'Brevo Call Consent'),
+    ('x_brevo_email_consent', 'Brevo Email Consent'),
+)
+
+# (field name, label) selection choices, formatted and deduplicated once at import
+_PARTNER_FIELD_CHOICES = tuple(dict.fromkeys(
+    (field_name, f"{field_name} ({field_label})")
+    for field_name, field_label in _STANDARD_PARTNER_FIELDS + _BREVO_PARTNER_FIELDS
+))
+
 
 class BrevoFieldDiscovery(models.Model):
     """Model for discovering and mapping Brevo contact fields to Odoo partner fields"""
@@ -56,156 +176,40 @@ class BrevoFieldDiscovery(models.Model):
     mapping_id = fields.Many2one(
         'brevo.field.mapping',
         string='Field Mapping',
+        compute='_compute_mapping_id',
+        store=True,
         help='The field mapping record if this field is mapped'
     )
 
     company_id = fields.Many2one(
         'res.company',
         string='Company',
-        default=lambda self: self.env.company
+        default=lambda self: self.env.company.id
     )
 
+    def init(self):
+        # Company wipe-and-reload and per-company field lookups
+        tools.create_index(self._cr, 'brevo_field_discovery_company_field_idx', self._table, ['company_id', 'brevo_field_name'])
+
     @api.model
     def _get_odoo_field_selection(self):
         """Get available Odoo partner fields for selection"""
         try:
-            partner_model = self.env['res.partner']
-            # Always provide a placeholder to avoid Owl selection rendering issues
-            fields_list = [('', 'Select...')]
-            
-            # Add standard Odoo fields
-            standard_fields = [
-                ('name', 'Name'),
-                ('email', 'Email'),
-                ('phone', 'Phone'),
-                ('mobile', 'Mobile'),
-                ('street', 'Street'),
-                ('street2', 'Street2'),
-                ('city', 'City'),
-                ('zip', 'ZIP'),
-                ('website', 'Website'),
-                ('comment', 'Notes'),
-                ('title', 'Title'),
-                ('function', 'Job Position'),
-                ('parent_id', 'Company'),
-                ('country_id', 'Country'),
-                ('state_id', 'State'),
-                ('category_id', 'Tags'),
-                ('is_company', 'Is Company'),
-                ('customer_rank', 'Customer Rank'),
-                ('supplier_rank', 'Supplier Rank'),
-                ('lang', 'Language'),
-                ('tz', 'Timezone'),
-                ('date', 'Date of Birth'),
-                ('industry_id', 'Industry'),
-                ('company_name', 'Company Name'),
-                ('company_type', 'Company Type'),
-                ('user_id', 'Salesperson'),
-                ('team_id', 'Sales Team'),
-                ('ref', 'Reference'),
-                ('barcode', 'Barcode'),
-                ('active', 'Active'),
-            ]
-            
-            for field_name, field_label in standard_fields:
-                if field_name in partner_model._fields:
-                    fields_list.append((field_name, f"{field_name} ({field_label})"))
-            
-            # Add Brevo custom fields
-            brevo_fields = [
-                ('x_brevo_age', 'Brevo Age'),
-                ('x_brevo_gender', 'Brevo Gender'),
-                ('x_brevo_middlename', 'Brevo Middle Name'),
-                ('x_brevo_nickname', 'Brevo Nickname'),
-                ('x_brevo_fax', 'Brevo Fax'),
-                ('x_brevo_skype', 'Brevo Skype'),
-                ('x_brevo_linkedin', 'Brevo LinkedIn'),
-                ('x_brevo_twitter', 'Brevo Twitter'),
-                ('x_brevo_facebook', 'Brevo Facebook'),
-                ('x_brevo_instagram', 'Brevo Instagram'),
-                ('x_brevo_youtube', 'Brevo YouTube'),
-                ('x_brevo_tiktok', 'Brevo TikTok'),
-                ('x_brevo_latitude', 'Brevo Latitude'),
-                ('x_brevo_longitude', 'Brevo Longitude'),
-                ('x_brevo_department', 'Brevo Department'),
-                ('x_brevo_company_size', 'Brevo Company Size'),
-                ('x_brevo_annual_revenue', 'Brevo Annual Revenue'),
-                ('x_brevo_employees', 'Brevo Employees'),
-                ('x_brevo_company_website', 'Brevo Company Website'),
-                ('x_brevo_company_phone', 'Brevo Company Phone'),
-                ('x_brevo_company_email', 'Brevo Company Email'),
-                ('x_brevo_source', 'Brevo Source'),
-                ('x_brevo_campaign', 'Brevo Campaign'),
-                ('x_brevo_utm_medium', 'Brevo UTM Medium'),
-                ('x_brevo_utm_campaign', 'Brevo UTM Campaign'),
-                ('x_brevo_utm_term', 'Brevo UTM Term'),
-                ('x_brevo_utm_content', 'Brevo UTM Content'),
-                ('x_brevo_referrer', 'Brevo Referrer'),
-                ('x_brevo_landing_page', 'Brevo Landing Page'),
-                ('x_brevo_subscriber_type', 'Brevo Subscriber Type'),
-                ('x_brevo_subscription_status', 'Brevo Subscription Status'),
-                ('x_brevo_opt_in_date', 'Brevo Opt-in Date'),
-                ('x_brevo_opt_out_date', 'Brevo Opt-out Date'),
-                ('x_brevo_last_activity', 'Brevo Last Activity'),
-                ('x_brevo_last_open', 'Brevo Last Open'),
-                ('x_brevo_last_click', 'Brevo Last Click'),
-                ('x_brevo_email_frequency', 'Brevo Email Frequency'),
-                ('x_brevo_communication_preference', 'Brevo Communication Preference'),
-                ('x_brevo_custom_field_1', 'Brevo Custom Field 1'),
-                ('x_brevo_custom_field_2', 'Brevo Custom Field 2'),
-                ('x_brevo_custom_field_3', 'Brevo Custom Field 3'),
-                ('x_brevo_custom_field_4', 'Brevo Custom Field 4'),
-                ('x_brevo_custom_field_5', 'Brevo Custom Field 5'),
-                ('x_brevo_segment', 'Brevo Segment'),
-                ('x_brevo_score', 'Brevo Score'),
-                ('x_brevo_priority', 'Brevo Priority'),
-                ('x_brevo_status', 'Brevo Status'),
-                ('x_brevo_stage', 'Brevo Stage'),
-                ('x_brevo_type', 'Brevo Type'),
-                ('x_brevo_rating', 'Brevo Rating'),
-                ('x_brevo_salary', 'Brevo Salary'),
-                ('x_brevo_budget', 'Brevo Budget'),
-                ('x_brevo_interest', 'Brevo Interest'),
-                ('x_brevo_hobby', 'Brevo Hobby'),
-                ('x_brevo_education', 'Brevo Education'),
-                ('x_brevo_experience', 'Brevo Experience'),
-                ('x_brevo_skills', 'Brevo Skills'),
-                ('x_brevo_certifications', 'Brevo Certifications'),
-                ('x_brevo_languages', 'Brevo Languages'),
-                ('x_brevo_availability', 'Brevo Availability'),
-                ('x_brevo_preferred_contact_time', 'Brevo Preferred Contact Time'),
-                ('x_brevo_preferred_contact_method', 'Brevo Preferred Contact Method'),
-                ('x_brevo_consent_date', 'Brevo Consent Date'),
-                ('x_brevo_consent_source', 'Brevo Consent Source'),
-                ('x_brevo_consent_text', 'Brevo Consent Text'),
-                ('x_brevo_gdpr_consent', 'Brevo GDPR Consent'),
-                ('x_brevo_marketing_consent', 'Brevo Marketing Consent'),
-                ('x_brevo_newsletter_consent', 'Brevo Newsletter Consent'),
-                ('x_brevo_sms_consent', 'Brevo SMS Consent'),
-                ('x_brevo_call_consent', 'Brevo Call Consent'),
-                ('x_brevo_email_consent', 'Brevo Email Consent'),
-            ]
-            
-            for field_name, field_label in brevo_fields:
-                if field_name in partner_model._fields:
-                    fields_list.append((field_name, f"{field_name} ({field_label})"))
-
-            # Deduplicate defensively to avoid malformed selections
-            seen = set()
-            unique_fields = []
-            for val, lab in fields_list:
-                key = (val, lab)
-                if key in seen:
-                    continue
-                seen.add(key)
-                unique_fields.append((val, lab))
-
-            return unique_fields
-            
+            return list(self._odoo_field_selection())
         except Exception as e:
-            _logger.error(f"Error getting Odoo field selection: {str(e)}")
+            _logger.error("Error getting Odoo field selection: %s", e)
             return [('', 'Error loading fields')]
 
+    @api.model
+    @tools.ormcache()
+    def _odoo_field_selection(self):
+        """Partner field choices, cached in the registry since res.partner fields only change on reload"""
+        partner_fields = self.env['res.partner']._fields
+        # Always provide a placeholder to avoid Owl selection rendering issues
+        return (('', 'Select...'),) + tuple(
+            choice for choice in _PARTNER_FIELD_CHOICES if choice[0] in partner_fields
+        )
+
     @api.onchange('odoo_field_name')
     def _onchange_odoo_field_name(self):
         """Update Odoo field information when field is selected"""
@@ -243,87 +247,42 @@ class BrevoFieldDiscovery(models.Model):
         self._sanitize_invalid_odoo_field_values()
         return super().read(fields=fields, load=load)
 
-    @api.depends('brevo_field_name', 'odoo_field_name')
+    @api.model
+    def _clear_company_records(self, company_id):
+        """Delete all discovery records of a company with a single DELETE statement"""
+        self.check_access('unlink')
+        self.flush_model()
+        self.env.cr.execute("DELETE FROM brevo_field_discovery WHERE company_id = %s", (company_id,))
+        self.invalidate_model()
+
+    @api.depends('mapping_id')
     def _compute_is_mapped(self):
         """Compute if this field combination is mapped"""
         for record in self:
-            if record.brevo_field_name and record.odoo_field_name:
-                mapping = self.env['brevo.field.mapping'].search([
-                    ('brevo_field_name', '=', record.brevo_field_name),
-                    ('company_id', '=', record.company_id.id)
-                ], limit=1)
-                record.is_mapped = bool(mapping)
-                record.mapping_id = mapping.id if mapping else False
-            else:
-                record.is_mapped = False
-                record.mapping_id = False
+            record.is_mapped = bool(record.mapping_id)
+
+    @api.depends('brevo_field_name', 'odoo_field_name', 'company_id')
+    def _compute_mapping_id(self):
+        """Find the mapping of each discovered field combination"""
+        # One query for the mappings of all records instead of a search per record
+        to_match = self.filtered(lambda r: r.brevo_field_name and r.odoo_field_name)
+        mappings = {}
+        if to_match:
+            for mapping in self.env['brevo.field.mapping'].search([
+                ('brevo_field_name', 'in', list(set(to_match.mapped('brevo_field_name')))),
+                ('odoo_field_name', 'in', list(set(to_match.mapped('odoo_field_name')))),
+                ('company_id', 'in', to_match.company_id.ids)
+            ]):
+                mappings[mapping.brevo_field_name, mapping.odoo_field_name, mapping.company_id.id] = mapping
+        for record in self:
+            key = (record.brevo_field_name, record.odoo_field_name, record.company_id.id)
+            mapping = record in to_match and mappings.get(key)
+            record.mapping_id = mapping.id if mapping else False
 
     def action_create_mapping(self):
         """Create a field mapping for this discovered field"""
         self.ensure_one()
-
-        # Get Odoo field info
-        odoo_field = self.env['res.partner']._fields.get(self.odoo_field_name)
-        if not odoo_field:
-            raise ValidationError(_('Odoo field %s does not exist') % self.odoo_field_name)
-
-        # Determine field type
-        field_type = 'char'
-        if odoo_field.type == 'text':
-            field_type = 'text'
-        elif odoo_field.type == 'integer':
-            field_type = 'integer'
-        elif odoo_field.type == 'float':
-            field_type = 'float'
-        elif odoo_field.type == 'boolean':
-            field_type = 'boolean'
-        elif odoo_field.type == 'date':
-            field_type = 'date'
-        elif odoo_field.type == 'datetime':
-            field_type = 'datetime'
-        elif odoo_field.type == 'selection':
-            field_type = 'selection'
-        elif odoo_field.type == 'many2one':
-            field_type = 'many2one'
-        elif odoo_field.type == 'many2many':
-            field_type = 'many2many'
-
-        # Upsert mapping: update existing (by brevo_field + company) or create
-        Mapping = self.env['brevo.field.mapping']
-        existing = Mapping.search([
-            ('brevo_field_name', '=', self.brevo_field_name),
-            ('company_id', '=', self.company_id.id)
-        ], limit=1)
-
-        if existing:
-            updates = {}
-            if existing.odoo_field_name != self.odoo_field_name:
-                updates['odoo_field_name'] = self.odoo_field_name
-            if existing.field_type != field_type:
-                updates['field_type'] = field_type
-            desired_name = f'{self.brevo_field_name} -> {self.odoo_field_name}'
-            if existing.name != desired_name:
-                updates['name'] = desired_name
-            if existing.active is False:
-                updates['active'] = True
-            if updates:
-                existing.write(updates)
-            mapping = existing
-        else:
-            mapping_vals = {
-                'name': f'{self.brevo_field_name} -> {self.odoo_field_name}',
-                'brevo_field_name': self.brevo_field_name,
-                'odoo_field_name': self.odoo_field_name,
-                'field_type': field_type,
-                'active': True,
-                'company_id': self.company_id.id,
-            }
-            mapping = Mapping.create(mapping_vals)
-
-        # Force refresh of computed fields
-        self.invalidate_recordset()
-        self.refresh()
-
+        self._save_mappings()
         return {
             'type': 'ir.actions.client',
             'tag': 'display_notification',
@@ -333,3 +292,75 @@ class BrevoFieldDiscovery(models.Model):
                 'type': 'success',
             }
         }
+
+    def action_create_mapping_multi(self):
+        """Create field mappings for all selected discovered fields at once"""
+        records = self.filtered('odoo_field_name')
+        records._save_mappings()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': _('Mappings Saved'),
+                'message': _('%d field mappings saved') % len(records),
+                'type': 'success',
+            }
+        }
+
+    def _save_mappings(self):
+        """Upsert the field mappings of these rows: update existing (by brevo_field + company), create the rest in one batch"""
+        partner_fields = self.env['res.partner']._fields
+        for record in self:
+            if record.odoo_field_name not in partner_fields:
+                raise ValidationError(_('Odoo field %s does not exist') % record.odoo_field_name)
+
+        Mapping = self.env['brevo.field.mapping'].with_context(active_test=False)
+        existing = {}
+        # (brevo field, odoo field, company) triples already taken, for a friendly uniqueness check
+        taken = set()
+        for mapping in Mapping.search([
+            ('brevo_field_name', 'in', list(set(self.mapped('brevo_field_name')))),
+            ('company_id', 'in', self.company_id.ids)
+        ], order='id'):
+            existing.setdefault((mapping.brevo_field_name, mapping.company_id.id), mapping)
+            taken.add((mapping.brevo_field_name, mapping.odoo_field_name, mapping.company_id.id))
+
+        to_create = {}
+        for record in self:
+            key = (record.brevo_field_name, record.company_id.id)
+            # Determine field type; anything not mappable as such is synced as char
+            field_type = partner_fields[record.odoo_field_name].type
+            if field_type not in _MAPPABLE_FIELD_TYPES:
+                field_type = 'char'
+            mapping_vals = {
+                'name': f'{record.brevo_field_name} -> {record.odoo_field_name}',
+                'odoo_field_name': record.odoo_field_name,
+                'field_type': field_type,
+                'active': True,
+            }
+            mapping = existing.get(key)
+            if mapping:
+                updates = {fname: value for fname, value in mapping_vals.items() if mapping[fname] != value}
+                if 'odoo_field_name' in updates and (key[0], record.odoo_field_name, key[1]) in taken:
+                    raise ValidationError(
+                        _('A mapping for Brevo field "%s" to Odoo field "%s" already exists for this company.')
+                        % (record.brevo_field_name, record.odoo_field_name)
+                    )
+                if updates:
+                    mapping.write(updates)
+            else:
+                # Of several rows for the same Brevo field and company, the last one wins
+                to_create[key] = dict(mapping_vals, brevo_field_name=key[0], company_id=key[1])
+        if to_create:
+            existing.update(zip(to_create, Mapping.create(list(to_create.values()))))
+
+        # The mapping of every row is known here: assign it instead of recomputing through another search
+        rows_by_mapping = {}
+        for record in self:
+            mapping = existing[(record.brevo_field_name, record.company_id.id)]
+            if mapping.odoo_field_name != record.odoo_field_name:
+                # Another selected row of the same Brevo field won: this combination is not mapped
+                mapping = Mapping
+            rows_by_mapping[mapping] = rows_by_mapping.get(mapping, self.browse()) | record
+        for mapping, rows in rows_by_mapping.items():
+            rows.write({'mapping_id': mapping.id})
@@ -2,11 +2,51 @@
 
 import logging
 import json
+from datetime import date, datetime
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
 
 _logger = logging.getLogger(__name__)
 
+# Mapping fields brevo.field.discovery matches its rows on (active: archived mappings do not count)
+_DISCOVERY_KEY_FIELDS = frozenset(('brevo_field_name', 'odoo_field_name', 'company_id', 'active'))
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _to_datetime(value):
+    """Parse an ISO 8601 Brevo date, where a trailing Z means UTC"""
+    if not isinstance(value, str):
+        return value
+    try:
+        if value.endswith('Z'):
+            return datetime.fromisoformat(value[:-1] + '+00:00')
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+# Conversion of Brevo attribute values per mapping field type; other types are used as-is
+_BREVO_VALUE_CONVERTERS = {
+    'integer': _to_int,
+    'float': _to_float,
+    'boolean': bool,
+    'date': _to_datetime,
+    'datetime': _to_datetime,
+}
+
 
 class BrevoFieldMapping(models.Model):
     """Model for mapping Brevo contact fields to Odoo partner fields"""
@@ -91,25 +131,42 @@ class BrevoFieldMapping(models.Model):
     company_id = fields.Many2one(
         'res.company',
         string='Company',
-        default=lambda self: self.env.company
+        required=True,
+        default=lambda self: self.env.company.id
     )
     
-    @api.constrains('brevo_field_name', 'odoo_field_name', 'company_id')
-    def _check_unique_mapping(self):
-        """Ensure unique field mapping per company"""
-        for record in self:
-            existing = self.search([
-                ('brevo_field_name', '=', record.brevo_field_name),
-                ('odoo_field_name', '=', record.odoo_field_name),
-                ('company_id', '=', record.company_id.id),
-                ('id', '!=', record.id)
-            ])
-            if existing:
-                raise ValidationError(
-                    _('A mapping for Brevo field "%s" to Odoo field "%s" already exists for this company.')
-                    % (record.brevo_field_name, record.odoo_field_name)
-                )
+    _sql_constraints = [
+        ('brevo_odoo_company_unique', 'unique(brevo_field_name, odoo_field_name, company_id)',
+         'A mapping between these Brevo and Odoo fields already exists for this company!'),
+    ]
     
+    @api.model_create_multi
+    def create(self, vals_list):
+        mappings = super().create(vals_list)
+        mappings._refresh_discovery_mapping()
+        return mappings
+
+    def write(self, vals):
+        if _DISCOVERY_KEY_FIELDS.isdisjoint(vals):
+            return super().write(vals)
+        # Both the discovery rows of the old and of the new field combinations are affected
+        self._refresh_discovery_mapping()
+        result = super().write(vals)
+        self._refresh_discovery_mapping()
+        return result
+
+    def unlink(self):
+        self._refresh_discovery_mapping()
+        return super().unlink()
+
+    def _refresh_discovery_mapping(self):
+        """Mark the discovery rows of these mappings' Brevo fields for recomputation of their mapping"""
+        discoveries = self.env['brevo.field.discovery'].search([
+            ('brevo_field_name', 'in', list(set(self.mapped('brevo_field_name')))),
+            ('company_id', 'in', self.company_id.ids),
+        ])
+        discoveries.modified(['brevo_field_name'])
+
     @api.constrains('field_type', 'selection_values')
     def _check_selection_values(self):
         """Validate selection values for selection fields"""
@@ -166,59 +223,60 @@ class BrevoFieldMapping(models.Model):
             return None
         
         # Convert value based on field type
-        if self.field_type == 'integer':
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return None
-        elif self.field_type == 'float':
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-        elif self.field_type == 'boolean':
-            return bool(value)
-        elif self.field_type in ['date', 'datetime']:
-            try:
-                from datetime import datetime
-                if isinstance(value, str):
-                    return datetime.fromisoformat(value.replace('Z', '+00:00'))
-                return value
-            except (ValueError, TypeError):
-                return None
-        
-        return value
+        converter = _BREVO_VALUE_CONVERTERS.get(self.field_type)
+        return converter(value) if converter else value
     
     def set_field_value_in_odoo(self, partner, value):
         """Set field value in Odoo partner record"""
         self.ensure_one()
-        
-        if value is None:
-            return
-        
-        # For dynamic fields, we store them in brevo_dynamic_fields
-        if not hasattr(partner, self.odoo_field_name):
-            # Store in dynamic fields JSON
-            dynamic_fields = {}
-            if partner.brevo_dynamic_fields:
-                try:
-                    dynamic_fields = json.loads(partner.brevo_dynamic_fields)
-                except (json.JSONDecodeError, TypeError):
-                    dynamic_fields = {}
-            
-            dynamic_fields[self.odoo_field_name] = value
-            partner.brevo_dynamic_fields = json.dumps(dynamic_fields)
-        else:
-            # Set the actual field if it exists
-            setattr(partner, self.odoo_field_name, value)
+        self._apply_values(partner, {self: value})
+
+    @api.model
+    def _apply_values(self, partner, mapping_to_value):
+        """Set the values of several mappings on a partner with one write.
+
+        Each value is checked before the write, so a value the field rejects (e.g. a Brevo
+        string for a many2one) is logged and skipped instead of failing the other fields.
+        """
+        vals = {}
+        dynamic_values = {}
+        for mapping, value in mapping_to_value.items():
+            if value is None:
+                continue
+            field = partner._fields.get(mapping.odoo_field_name)
+            try:
+                if field:
+                    # convert_to_cache turns e.g. a Brevo string for a many2one into None instead of
+                    # failing, which would clear the field: only accept IDs, commands or records
+                    if field.relational and not isinstance(value, (int, list, tuple, models.BaseModel)):
+                        raise ValueError(f"{field.name} expects record IDs, not {value!r}")
+                    field.convert_to_cache(value, partner)
+                else:
+                    # For dynamic fields, we store them in brevo_dynamic_fields
+                    json.dumps(value)
+            except (ValueError, TypeError) as e:
+                _logger.warning("Skipping value %r of Brevo field %s for partner %s: %s",
+                                value, mapping.brevo_field_name, partner.id, e)
+                continue
+            if field:
+                vals[mapping.odoo_field_name] = value
+            else:
+                dynamic_values[mapping.odoo_field_name] = value
+
+        if dynamic_values:
+            vals['brevo_dynamic_fields'] = dict(partner.brevo_dynamic_fields or {}, **dynamic_values)
+
+        if vals:
+            partner.write(vals)
 
     def get_field_value_from_odoo(self, partner):
         """Get field value from Odoo partner record"""
         self.ensure_one()
         
         try:
-            if hasattr(partner, self.odoo_field_name):
-                value = getattr(partner, self.odoo_field_name)
+            # Check the field registry instead of hasattr, which would read the field a second time
+            if self.odoo_field_name in partner._fields:
+                value = partner[self.odoo_field_name]
                 
                 # Convert Odoo objects to strings for Brevo API
                 if hasattr(value, 'name'):
@@ -230,10 +288,8 @@ class BrevoFieldMapping(models.Model):
                 elif isinstance(value, (list, tuple)):
                     # Many2many fields - join with comma
                     return ', '.join([item.name if hasattr(item, 'name') else str(item) for item in value])
-                elif isinstance(value, fields.Date):
-                    # Convert Odoo date to ISO string
-                    return value.isoformat()
-                elif isinstance(value, fields.Datetime):
+                elif isinstance(value, date):
+                    # Convert Odoo date and datetime values (datetime is a date subclass) to ISO strings
                     return value.isoformat()
                 elif value is False:
                     return False
@@ -244,13 +300,7 @@ class BrevoFieldMapping(models.Model):
                     return value
             else:
                 # Try to get from dynamic fields JSON
-                if partner.brevo_dynamic_fields:
-                    try:
-                        dynamic_fields = json.loads(partner.brevo_dynamic_fields)
-                        return dynamic_fields.get(self.odoo_field_name)
-                    except (json.JSONDecodeError, TypeError):
-                        pass
-                return None
+                return (partner.brevo_dynamic_fields or {}).get(self.odoo_field_name)
         except Exception as e:
-            _logger.error(f"Failed to get field value from Odoo: {str(e)}")
+            _logger.error("Failed to get field value from Odoo: %s", e)
             return None
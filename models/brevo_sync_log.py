@@ -123,7 +123,7 @@ class BrevoSyncLog(models.Model):
     company_id = fields.Many2one(
         'res.company',
         string='Company',
-        default=lambda self: self.env.company,
+        default=lambda self: self.env.company.id,
         required=True
     )
 
@@ -157,8 +157,21 @@ class BrevoSyncLog(models.Model):
             if field in kwargs:
                 log_vals[field] = kwargs[field]
         
+        if self.env.context.get('brevo_log_buffer'):
+            # Batch callers (webhook inbox cron) insert all entries at commit in one query
+            buffer = self.env.cr.precommit.data.setdefault('brevo.sync.log.buffer', [])
+            if not buffer:
+                self.env.cr.precommit.add(self._flush_log_buffer)
+            buffer.append(log_vals)
+            return self.browse()
         return self.create(log_vals)
 
+    def _flush_log_buffer(self):
+        """Insert the buffered log entries of this transaction"""
+        buffer = self.env.cr.precommit.data.pop('brevo.sync.log.buffer', [])
+        if buffer:
+            self.sudo().with_context(brevo_log_buffer=False).create(buffer)
+
     @api.model
     def log_success(self, operation, direction, message, **kwargs):
         """Log a successful operation"""
@@ -212,7 +225,7 @@ class BrevoSyncLog(models.Model):
         
         if old_logs:
             old_logs.unlink()
-            _logger.info(f"Cleaned up {len(old_logs)} old sync log entries")
+            _logger.info("Cleaned up %s old sync log entries", len(old_logs))
 
     def action_view_related_record(self):
         """Action to view the related record"""
@@ -275,6 +288,6 @@ class BrevoSyncLog(models.Model):
             ])
             error_logs.unlink()
             
-            _logger.info(f"Cleaned up old Brevo sync logs: {len(success_logs)} success logs, {len(error_logs)} error logs")
+            _logger.info("Cleaned up old Brevo sync logs: %s success logs, %s error logs", len(success_logs), len(error_logs))
         except Exception as e:
-            _logger.error(f"Failed to cleanup old Brevo sync logs: {str(e)}")
+            _logger.error("Failed to cleanup old Brevo sync logs: %s", e)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from odoo import models, fields, api
+
+_logger = logging.getLogger(__name__)
+
+
+class BrevoWebhookDedup(models.Model):
+    """Idempotency keys of processed Brevo webhook events, used to drop redelivered retries"""
+    _name = 'brevo.webhook.dedup'
+    _description = 'Brevo Webhook Idempotency Key'
+    _log_access = False
+    _rec_name = 'event_key'
+
+    event_key = fields.Char(
+        string='Event Key',
+        required=True,
+        help='Event type and Brevo record ID of a processed webhook'
+    )
+
+    received_at = fields.Datetime(
+        string='Received At',
+        required=True,
+        index=True,
+        default=fields.Datetime.now,
+        help='When this event was first processed'
+    )
+
+    _sql_constraints = [
+        ('event_key_unique', 'unique(event_key)', 'Webhook event key must be unique!'),
+    ]
+
+    @api.model
+    def _claim(self, event_key):
+        """Register an event key; return False if it was already processed"""
+        self.env.cr.execute(
+            "INSERT INTO brevo_webhook_dedup (event_key, received_at) VALUES (%s, NOW() AT TIME ZONE 'UTC') "
+            "ON CONFLICT (event_key) DO NOTHING RETURNING id",
+            (event_key,)
+        )
+        return bool(self.env.cr.fetchone())
+
+    @api.model
+    def _cleanup_old_keys(self, days=1):
+        """Remove idempotency keys older than the given number of days"""
+        cutoff_date = fields.Datetime.subtract(fields.Datetime.now(), days=days)
+        self.env.cr.execute("DELETE FROM brevo_webhook_dedup WHERE received_at < %s", (cutoff_date,))
+        if self.env.cr.rowcount:
+            _logger.info("Cleaned up %s Brevo webhook idempotency keys", self.env.cr.rowcount)
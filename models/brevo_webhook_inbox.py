@@ -0,0 +1,513 @@
+# -*- coding: utf-8 -*-
+
+import logging
+import json
+from odoo import models, fields, api, _
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from ..services.brevo_sync_service import SYNC_CONTEXT
+
+_logger = logging.getLogger(__name__)
+
+# Brevo contact attribute -> res.partner field, copied when present and different
+_BREVO_FIELD_MAP = (
+    ('SMS', 'mobile'),
+    ('ADDRESS', 'street'),
+    ('CITY', 'city'),
+    ('ZIP', 'zip'),
+)
+
+
+class BrevoWebhookInbox(models.Model):
+    """Raw Brevo webhook deliveries, stored by the controller and processed in the background"""
+    _name = 'brevo.webhook.inbox'
+    _description = 'Brevo Webhook Inbox'
+    _order = 'id'
+    _rec_name = 'event_type'
+
+    # Cron processing each channel, so slow CRM bookings never starve contact syncs
+    _CHANNEL_CRONS = {
+        'contact': 'brevo_connector.ir_cron_brevo_webhook_inbox_contact',
+        'booking': 'brevo_connector.ir_cron_brevo_webhook_inbox_booking',
+    }
+
+    # Event type -> handler method; meetings and calls are processed like bookings
+    _HANDLERS = {
+        'contact.created': '_handle_contact_created',
+        'contact.updated': '_handle_contact_updated',
+        'contact.deleted': '_handle_contact_deleted',
+        'list.created': '_handle_list_created',
+        'list.updated': '_handle_list_updated',
+        'list.deleted': '_handle_list_deleted',
+        'booking.created': '_handle_booking_created',
+        'booking.updated': '_handle_booking_updated',
+        'booking.started': '_handle_booking_updated',
+        'booking.cancelled': '_handle_booking_cancelled',
+        'meeting.created': '_handle_booking_created',
+        'meeting.updated': '_handle_booking_updated',
+        'meeting.started': '_handle_booking_updated',
+        'meeting.cancelled': '_handle_booking_cancelled',
+        'call.created': '_handle_booking_created',
+        'call.updated': '_handle_booking_updated',
+        'call.started': '_handle_booking_updated',
+        'call.cancelled': '_handle_booking_cancelled',
+    }
+
+    # Events that must run at most once per Brevo record: Brevo retries would otherwise create duplicate leads
+    _IDEMPOTENT_EVENTS = frozenset(('booking.created', 'meeting.created', 'call.created'))
+
+    raw_body = fields.Text(
+        string='Raw Body',
+        required=True,
+        help='Webhook payload exactly as received from Brevo'
+    )
+
+    headers_json = fields.Text(
+        string='Headers',
+        help='HTTP headers of the webhook request (JSON format)'
+    )
+
+    event_type = fields.Char(
+        string='Event Type',
+        index=True,
+        help='Brevo event type (e.g., contact.updated, meeting.created)'
+    )
+
+    channel = fields.Selection([
+        ('contact', 'Contacts & Lists'),
+        ('booking', 'Bookings'),
+    ], string='Channel', required=True, default='contact', index=True)
+
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('done', 'Done'),
+        ('error', 'Error'),
+    ], string='State', required=True, default='pending', index=True)
+
+    result_message = fields.Text(
+        string='Result',
+        help='Result message of the processing'
+    )
+
+    processed_at = fields.Datetime(
+        string='Processed At',
+        help='When this webhook was processed'
+    )
+
+    @api.model
+    def _get_channel(self, event_type):
+        """Return the processing channel for an event type"""
+        if (event_type or '').startswith(('booking.', 'meeting.', 'call.')):
+            return 'booking'
+        return 'contact'
+
+    @api.model
+    def enqueue(self, raw_body, headers=None, event_type=None, channel=None):
+        """Store a webhook delivery and wake up the cron of its channel"""
+        channel = channel or self._get_channel(event_type)
+        record = self.create({
+            'raw_body': raw_body,
+            'headers_json': json.dumps(headers or {}),
+            'event_type': event_type,
+            'channel': channel,
+        })
+        cron = self.env.ref(self._CHANNEL_CRONS[channel], raise_if_not_found=False)
+        if cron:
+            cron._trigger()
+        return record
+
+    @api.model
+    def _cron_process_inbox(self, channel, limit=200):
+        """Method for cron job to process pending webhooks of a channel"""
+        # Sync log entries of the whole batch are written in one INSERT at commit, and the
+        # synced records get no per-record chatter messages or tracking
+        self = self.with_context(brevo_log_buffer=True, **SYNC_CONTEXT)
+        pending = self.search([
+            ('channel', '=', channel),
+            ('state', '=', 'pending'),
+        ], limit=limit)
+        payloads = pending._load_payloads()
+        partners = self._prefetch_partners(payloads) if channel == 'contact' else None
+        for record in pending:
+            record._process(payload=payloads.get(record.id), partners=partners)
+        if len(pending) == limit:
+            # More work queued: run again right away instead of waiting for the next interval
+            cron = self.env.ref(self._CHANNEL_CRONS[channel], raise_if_not_found=False)
+            if cron:
+                cron._trigger()
+
+    def _load_payloads(self):
+        """Parse the stored bodies, keyed by record ID; undecodable ones are left out"""
+        payloads = {}
+        for record in self:
+            try:
+                payloads[record.id] = json_loads(record.raw_body)
+            except ValueError:
+                continue
+        return payloads
+
+    @api.model
+    def _prefetch_partners(self, payloads):
+        """Fetch the partners referenced by contact events in one query, keyed by Brevo ID.
+
+        IDs without a partner map to an empty recordset, so the handlers know not to search again.
+        """
+        brevo_ids = set()
+        for webhook_data in payloads.values():
+            if not isinstance(webhook_data, dict) or not (webhook_data.get('event') or '').startswith('contact.'):
+                continue
+            event_data = webhook_data.get('data')
+            if isinstance(event_data, dict) and event_data.get('id'):
+                brevo_ids.add(str(event_data['id']))
+        Partner = self.env['res.partner']
+        partners = dict.fromkeys(brevo_ids, Partner)
+        if brevo_ids:
+            for partner in Partner.search([('brevo_id', 'in', list(brevo_ids))]):
+                if not partners[partner.brevo_id]:
+                    partners[partner.brevo_id] = partner
+        return partners
+
+    def _process(self, payload=None, partners=None):
+        """Process this webhook delivery and store the outcome"""
+        self.ensure_one()
+        try:
+            webhook_data = payload if payload is not None else json_loads(self.raw_body)
+            if self.channel == 'booking':
+                webhook_data = {
+                    'event': webhook_data.get('event') or 'booking.created',
+                    'data': webhook_data.get('data') or webhook_data,
+                }
+            # One savepoint per event: a failing handler only rolls back its own writes.
+            # Not a flushing savepoint, which would also run (and on rollback drop) the buffered sync logs.
+            self.env.flush_all()
+            log_buffer = self.env.cr.precommit.data.setdefault('brevo.sync.log.buffer', [])
+            log_count = len(log_buffer)
+            with self.env.cr.savepoint(flush=False) as savepoint:
+                try:
+                    result = self._process_webhook(webhook_data, partners=partners)
+                    if result.get('success'):
+                        # Flush the handler's writes (ORM only, not the precommit hooks) before the
+                        # savepoint is released, so a failing write is rolled back with this event
+                        self.env.flush_all()
+                except Exception as e:
+                    _logger.error("Brevo webhook %s failed to store its changes: %s", self.id, e)
+                    result = {'success': False, 'error': str(e)}
+                if not result.get('success'):
+                    # Drop the handler's unflushed updates along with what it already wrote
+                    savepoint.rollback()
+                    self.env.transaction.clear()
+                    del log_buffer[log_count:]
+                    if partners is not None:
+                        # Whatever the batch cache holds for this contact may have been rolled back
+                        partners.pop(str((webhook_data.get('data') or {}).get('id')), None)
+        except Exception as e:
+            _logger.error("Brevo webhook inbox processing failed for %s: %s", self.id, e)
+            result = {'success': False, 'error': str(e)}
+
+        self.write({
+            'state': 'done' if result.get('success') else 'error',
+            'result_message': result.get('message') or result.get('error'),
+            'processed_at': fields.Datetime.now(),
+        })
+        return result
+
+    def action_retry(self):
+        """Put failed webhooks back into the queue"""
+        self.write({'state': 'pending', 'result_message': False, 'processed_at': False})
+        for channel in set(self.mapped('channel')):
+            cron = self.env.ref(self._CHANNEL_CRONS[channel], raise_if_not_found=False)
+            if cron:
+                cron._trigger()
+
+    @api.model
+    def _process_webhook(self, webhook_data, partners=None):
+        """Process webhook data based on event type"""
+        try:
+            event_type = webhook_data.get('event')
+            event_data = webhook_data.get('data', {})
+
+            if not event_type:
+                return {'success': False, 'error': 'No event type specified'}
+
+            # Route to appropriate handler
+            handler_name = self._HANDLERS.get(event_type)
+            if not handler_name:
+                _logger.warning("Unhandled webhook event type: %s", event_type)
+                return {'success': True, 'message': f'Unhandled event type: {event_type}'}
+
+            if event_type in self._IDEMPOTENT_EVENTS and event_data.get('id'):
+                event_key = f"{event_type}:{event_data['id']}"
+                if not self.env['brevo.webhook.dedup']._claim(event_key):
+                    return {'success': True, 'message': f'Duplicate delivery ignored: {event_key}'}
+
+            handler = getattr(self, handler_name)
+            if handler_name.startswith('_handle_contact_'):
+                return handler(event_data, partners=partners)
+            return handler(event_data)
+
+        except Exception as e:
+            _logger.error("Webhook processing failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    @api.model
+    def _find_partner(self, event_data, partners=None):
+        """Return the partner linked to the Brevo contact, from the prefetched batch when given"""
+        Partner = self.env['res.partner']
+        brevo_id = str(event_data.get('id'))
+        if partners is not None and brevo_id in partners:
+            return partners[brevo_id]
+        return Partner.search([('brevo_id', '=', brevo_id)], limit=1)
+
+    @api.model
+    def _create_partner(self, event_data, partners=None):
+        """Create a partner from Brevo data and remember it for the rest of the batch"""
+        partner = self.env['res.partner'].create_from_brevo_data(event_data)
+        brevo_id = str(event_data.get('id'))
+        if partners is not None and partner and partner.brevo_id == brevo_id:
+            partners[brevo_id] = partner
+        return partner
+
+    @api.model
+    def _handle_contact_created(self, event_data, partners=None):
+        """Handle contact creation webhook"""
+        try:
+            # Check if contact already exists
+            existing_partner = self._find_partner(event_data, partners)
+
+            if existing_partner:
+                # Update existing partner
+                self._update_partner_from_brevo_data(existing_partner, event_data)
+                return {'success': True, 'message': 'Existing partner updated'}
+            else:
+                # Create new partner
+                partner = self._create_partner(event_data, partners)
+                return {'success': True, 'message': f'New partner created: {partner.name}'}
+
+        except Exception as e:
+            _logger.error("Contact creation webhook failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    @api.model
+    def _handle_contact_updated(self, event_data, partners=None):
+        """Handle contact update webhook"""
+        try:
+            # Find existing partner
+            partner = self._find_partner(event_data, partners)
+
+            if partner:
+                self._update_partner_from_brevo_data(partner, event_data)
+                return {'success': True, 'message': f'Partner updated: {partner.name}'}
+            else:
+                # Create new partner if not found
+                partner = self._create_partner(event_data, partners)
+                return {'success': True, 'message': f'New partner created: {partner.name}'}
+
+        except Exception as e:
+            _logger.error("Contact update webhook failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    @api.model
+    def _handle_contact_deleted(self, event_data, partners=None):
+        """Handle contact deletion webhook"""
+        try:
+            # Find existing partner
+            partner = self._find_partner(event_data, partners)
+
+            if partner:
+                # Mark partner as archived instead of deleting
+                partner.write({'active': False})
+                if partners is not None:
+                    partners[partner.brevo_id] = self.env['res.partner']
+                return {'success': True, 'message': f'Partner archived: {partner.name}'}
+            else:
+                return {'success': True, 'message': 'Partner not found'}
+
+        except Exception as e:
+            _logger.error("Contact deletion webhook failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    @api.model
+    def _handle_list_created(self, event_data):
+        """Handle list creation webhook"""
+        ContactList = self.env['brevo.contact.list']
+        try:
+            # Check if list already exists
+            existing_list = ContactList.search([
+                ('brevo_id', '=', str(event_data.get('id')))
+            ], limit=1)
+
+            if existing_list:
+                # Update existing list
+                existing_list.update_from_brevo_data(event_data)
+                return {'success': True, 'message': 'Existing list updated'}
+            else:
+                # Create new list
+                contact_list = ContactList.create_from_brevo_data(event_data)
+                return {'success': True, 'message': f'New list created: {contact_list.name}'}
+
+        except Exception as e:
+            _logger.error("List creation webhook failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    @api.model
+    def _handle_list_updated(self, event_data):
+        """Handle list update webhook"""
+        ContactList = self.env['brevo.contact.list']
+        try:
+            # Find existing list
+            contact_list = ContactList.search([
+                ('brevo_id', '=', str(event_data.get('id')))
+            ], limit=1)
+
+            if contact_list:
+                contact_list.update_from_brevo_data(event_data)
+                return {'success': True, 'message': f'List updated: {contact_list.name}'}
+            else:
+                # Create new list if not found
+                contact_list = ContactList.create_from_brevo_data(event_data)
+                return {'success': True, 'message': f'New list created: {contact_list.name}'}
+
+        except Exception as e:
+            _logger.error("List update webhook failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    @api.model
+    def _handle_list_deleted(self, event_data):
+        """Handle list deletion webhook"""
+        ContactList = self.env['brevo.contact.list']
+        try:
+            # Find existing list
+            contact_list = ContactList.search([
+                ('brevo_id', '=', str(event_data.get('id')))
+            ], limit=1)
+
+            if contact_list:
+                # Mark list as inactive instead of deleting
+                contact_list.write({'active': False})
+                return {'success': True, 'message': f'List archived: {contact_list.name}'}
+            else:
+                return {'success': True, 'message': 'List not found'}
+
+        except Exception as e:
+            _logger.error("List deletion webhook failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    @api.model
+    def _handle_booking_created(self, event_data):
+        """Handle booking creation webhook"""
+        try:
+            # Create CRM lead from booking
+            lead = self.env['crm.lead'].create_from_brevo_booking(event_data)
+            return {'success': True, 'message': f'Lead created from booking: {lead.name}'}
+
+        except Exception as e:
+            _logger.error("Booking creation webhook failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    @api.model
+    def _handle_booking_updated(self, event_data):
+        """Handle booking update webhook"""
+        try:
+            # Update existing lead
+            lead = self.env['crm.lead'].process_brevo_webhook({
+                'event': 'booking.updated',
+                'data': event_data
+            })
+
+            if lead:
+                return {'success': True, 'message': f'Lead updated from booking: {lead.name}'}
+            else:
+                return {'success': True, 'message': 'No lead found to update'}
+
+        except Exception as e:
+            _logger.error("Booking update webhook failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    @api.model
+    def _handle_booking_cancelled(self, event_data):
+        """Handle booking cancellation webhook"""
+        try:
+            # Update existing lead
+            lead = self.env['crm.lead'].process_brevo_webhook({
+                'event': 'booking.cancelled',
+                'data': event_data
+            })
+
+            if lead:
+                return {'success': True, 'message': f'Lead updated from booking cancellation: {lead.name}'}
+            else:
+                return {'success': True, 'message': 'No lead found to update'}
+
+        except Exception as e:
+            _logger.error("Booking cancellation webhook failed: %s", e)
+            return {'success': False, 'error': str(e)}
+
+    @api.model
+    def _update_partner_from_brevo_data(self, partner, brevo_data):
+        """Update partner with data from Brevo webhook"""
+        SyncLog = self.env['brevo.sync.log']
+        try:
+            attributes = brevo_data.get('attributes', {})
+
+            update_vals = {
+                'brevo_sync_status': 'synced',
+                'brevo_last_sync': fields.Datetime.now(),
+                'brevo_sync_error': False,
+                'brevo_modified_date': brevo_data.get('modifiedAt'),
+            }
+
+            # Update basic fields if they're different
+            fname = attributes.get('VORNAME', '') or attributes.get('FNAME', '')
+            lname = attributes.get('NACHNAME', '') or attributes.get('LNAME', '')
+            if fname and lname:
+                new_name = f"{fname} {lname}".strip()
+                if new_name and new_name != partner.name:
+                    update_vals['name'] = new_name
+
+            for attribute, field_name in _BREVO_FIELD_MAP:
+                value = attributes.get(attribute)
+                if value and value != partner[field_name]:
+                    update_vals[field_name] = value
+
+            # No chatter message or tracking values for a webhook update, whatever the caller's context
+            partner.with_context(**SYNC_CONTEXT).write(update_vals)
+
+            # Log update
+            SyncLog.log_success(
+                'contact_update',
+                'brevo_to_odoo',
+                f'Partner {partner.name} updated from Brevo webhook',
+                partner_id=partner.id,
+                brevo_id=str(brevo_data.get('id')),
+                brevo_email=brevo_data.get('email')
+            )
+
+        except Exception as e:
+            _logger.error("Failed to update partner %s from Brevo webhook: %s", partner.id, e)
+
+            # Log error
+            SyncLog.log_error(
+                'contact_update',
+                'brevo_to_odoo',
+                f'Failed to update partner {partner.name} from Brevo webhook',
+                error_message=str(e),
+                partner_id=partner.id,
+                brevo_id=str(brevo_data.get('id')),
+                brevo_email=brevo_data.get('email')
+            )
+
+    @api.model
+    def _cleanup_processed(self, days=7):
+        """Remove processed webhooks older than the given number of days"""
+        cutoff_date = fields.Datetime.subtract(fields.Datetime.now(), days=days)
+        old_records = self.search([
+            ('state', '=', 'done'),
+            ('create_date', '<', cutoff_date),
+        ])
+        if old_records:
+            old_records.unlink()
+            _logger.info("Cleaned up %s processed Brevo webhooks", len(old_records))
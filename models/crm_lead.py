@@ -2,9 +2,11 @@
 
 import logging
 from datetime import datetime
-from odoo import models, fields, api, _
+from odoo import models, fields, api, _, SUPERUSER_ID
 from odoo.exceptions import ValidationError
 
+from ..services.brevo_sync_service import BrevoSyncService
+
 _logger = logging.getLogger(__name__)
 
 
@@ -85,8 +87,7 @@ class CrmLead(models.Model):
                     'phone': contact_data.get('phone', ''),
                 }
                 # Use system user for partner creation to bypass permission issues
-                system_user = self.env.ref('base.user_root')
-                partner = self.env['res.partner'].with_user(system_user).create(partner_vals)
+                partner = self.env['res.partner'].with_user(SUPERUSER_ID).create(partner_vals)
             
             # Extract booking information
             booking_time = normalized.get('startTime')
@@ -126,19 +127,18 @@ class CrmLead(models.Model):
                 lead_vals['type'] = 'lead'
             
             # Use system user for lead creation to bypass permission issues
-            system_user = self.env.ref('base.user_root')
-            lead = self.with_user(system_user).create(lead_vals)
+            lead = self.with_user(SUPERUSER_ID).create(lead_vals)
             
             # Log the creation (disabled for public user)
-            _logger.info(f'Lead created from Brevo booking: {lead.name}')
+            _logger.info("Lead created from Brevo booking: %s", lead.name)
             
             return lead
             
         except Exception as e:
-            _logger.error(f"Failed to create lead from Brevo booking: {str(e)}")
+            _logger.error("Failed to create lead from Brevo booking: %s", e)
             
             # Log the error (disabled for public user)
-            _logger.error(f'Failed to create lead from Brevo booking: {str(e)}')
+            _logger.error("Failed to create lead from Brevo booking: %s", e)
             
             raise ValidationError(_('Failed to create lead from Brevo booking: %s') % str(e))
 
@@ -202,8 +202,6 @@ class CrmLead(models.Model):
         try:
             if not self.partner_id or not self.partner_id.email:
                 raise ValidationError(_('Partner with email is required for Brevo sync'))
-            
-            from ..services.brevo_sync_service import BrevoSyncService
             config = self.env['brevo.config'].get_active_config()
             
             if not config:
@@ -213,9 +211,11 @@ class CrmLead(models.Model):
             result = sync_service.sync_lead_to_brevo(self)
             
             if result.get('success'):
-                self.brevo_sync_status = 'synced'
-                self.brevo_last_sync = fields.Datetime.now()
-                self.brevo_sync_error = False
+                self.write({
+                    'brevo_sync_status': 'synced',
+                    'brevo_last_sync': fields.Datetime.now(),
+                    'brevo_sync_error': False,
+                })
                 
                 return {
                     'type': 'ir.actions.client',
@@ -227,8 +227,10 @@ class CrmLead(models.Model):
                     }
                 }
             else:
-                self.brevo_sync_status = 'error'
-                self.brevo_sync_error = result.get('error', 'Unknown error')
+                self.write({
+                    'brevo_sync_status': 'error',
+                    'brevo_sync_error': result.get('error', 'Unknown error'),
+                })
                 
                 return {
                     'type': 'ir.actions.client',
@@ -240,9 +242,11 @@ class CrmLead(models.Model):
                     }
                 }
         except Exception as e:
-            _logger.error(f"Lead sync to Brevo failed: {str(e)}")
-            self.brevo_sync_status = 'error'
-            self.brevo_sync_error = str(e)
+            _logger.error("Lead sync to Brevo failed: %s", e)
+            self.write({
+                'brevo_sync_status': 'error',
+                'brevo_sync_error': str(e),
+            })
             
             return {
                 'type': 'ir.actions.client',
@@ -325,7 +329,7 @@ class CrmLead(models.Model):
             return False
             
         except Exception as e:
-            _logger.error(f"Failed to process Brevo webhook: {str(e)}")
+            _logger.error("Failed to process Brevo webhook: %s", e)
             
             # Log the error
             self.env['brevo.sync.log'].log_error(
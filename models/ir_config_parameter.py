@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, api, tools
+
+
+class IrConfigParameter(models.Model):
+    """Cached access to the Brevo webhook parameters and base URL tracking"""
+    _inherit = 'ir.config_parameter'
+
+    @api.model
+    @tools.ormcache()
+    def _get_brevo_webhook_config(self):
+        """Return (require_signature, secret_bytes) used to verify incoming webhooks.
+
+        Cached in the registry; ir.config_parameter already clears that cache
+        whenever a parameter is created, written or deleted.
+        """
+        ICP = self.sudo()
+        require_sig = ICP.get_param('brevo.webhook_require_signature', default='0') in ('1', 'true', 'True')
+        secret = ICP.get_param('brevo.webhook_secret') or ''
+        return require_sig, secret.encode('utf-8')
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._recompute_brevo_webhook_url()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self._recompute_brevo_webhook_url()
+        return res
+
+    def _recompute_brevo_webhook_url(self):
+        """Refresh the stored webhook URL of Brevo configurations when the base URL changes"""
+        if 'web.base.url' in self.mapped('key'):
+            configs = self.env['brevo.config'].sudo().with_context(active_test=False).search([])
+            self.env.add_to_compute(configs._fields['webhook_url'], configs)
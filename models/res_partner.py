@@ -5,6 +5,8 @@ from datetime import datetime
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
 
+from ..services.brevo_sync_service import BrevoSyncService
+
 _logger = logging.getLogger(__name__)
 
 
@@ -16,7 +18,7 @@ class ResPartner(models.Model):
     brevo_id = fields.Char(
         string='Brevo Contact ID',
         help='Unique identifier for this contact in Brevo',
-        index=True
+        index='btree_not_null'
     )
     
     brevo_sync_status = fields.Selection([
@@ -42,9 +44,10 @@ class ResPartner(models.Model):
     )
     
     # Dynamic Brevo Fields (will be created at runtime)
-    brevo_dynamic_fields = fields.Text(
+    brevo_dynamic_fields = fields.Json(
         string='Brevo Dynamic Fields',
-        help='JSON storage for dynamically created Brevo fields'
+        prefetch=False,
+        help='Values of mapped Brevo fields that have no partner column, by field name'
     )
     
     # Brevo Tags
@@ -155,8 +158,6 @@ class ResPartner(models.Model):
             
             if self.is_company:
                 raise ValidationError(_('Companies cannot be synced to Brevo'))
-            
-            from ..services.brevo_sync_service import BrevoSyncService
             config = self.env['brevo.config'].get_active_config()
             
             if not config:
@@ -166,10 +167,12 @@ class ResPartner(models.Model):
             result = sync_service.sync_partner_to_brevo(self)
             
             if result.get('success'):
-                self.brevo_sync_status = 'synced'
-                self.brevo_last_sync = fields.Datetime.now()
-                self.brevo_sync_error = False
-                self.brevo_sync_needed = False
+                self.write({
+                    'brevo_sync_status': 'synced',
+                    'brevo_last_sync': fields.Datetime.now(),
+                    'brevo_sync_error': False,
+                    'brevo_sync_needed': False,
+                })
                 
                 return {
                     'type': 'ir.actions.client',
@@ -181,8 +184,10 @@ class ResPartner(models.Model):
                     }
                 }
             else:
-                self.brevo_sync_status = 'error'
-                self.brevo_sync_error = result.get('error', 'Unknown error')
+                self.write({
+                    'brevo_sync_status': 'error',
+                    'brevo_sync_error': result.get('error', 'Unknown error'),
+                })
                 
                 return {
                     'type': 'ir.actions.client',
@@ -194,9 +199,11 @@ class ResPartner(models.Model):
                     }
                 }
         except Exception as e:
-            _logger.error(f"Partner sync to Brevo failed: {str(e)}")
-            self.brevo_sync_status = 'error'
-            self.brevo_sync_error = str(e)
+            _logger.error("Partner sync to Brevo failed: %s", e)
+            self.write({
+                'brevo_sync_status': 'error',
+                'brevo_sync_error': str(e),
+            })
             
             return {
                 'type': 'ir.actions.client',
@@ -296,5 +303,5 @@ class ResPartner(models.Model):
             return partner
             
         except Exception as e:
-            _logger.error(f"Failed to create partner from Brevo data: {str(e)}")
+            _logger.error("Failed to create partner from Brevo data: %s", e)
             raise ValidationError(_('Failed to create partner from Brevo data: %s') % str(e))
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import functools
 import logging
 import json
+import threading
 import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
 try:
     import brevo_python
@@ -17,6 +19,131 @@ except ImportError:
 
 _logger = logging.getLogger(__name__)
 
+# Persistent HTTP connections kept per Brevo API key
+CONNECTION_POOL_MAXSIZE = 10
+
+# Minimum spacing between two Brevo requests of one service (300 requests/minute)
+MIN_REQUEST_INTERVAL = 0.2
+
+# Standard Brevo contact attributes (the SDK has no AttributesApi to list them)
+CONTACT_ATTRIBUTES = (
+    # Personal Information
+    {'name': 'FNAME', 'type': 'text', 'category': 'personal'},
+    {'name': 'LNAME', 'type': 'text', 'category': 'personal'},
+    {'name': 'BIRTHDAY', 'type': 'date', 'category': 'personal'},
+    {'name': 'AGE', 'type': 'number', 'category': 'personal'},
+    {'name': 'GENDER', 'type': 'text', 'category': 'personal'},
+    {'name': 'TITLE', 'type': 'text', 'category': 'personal'},
+    {'name': 'FIRSTNAME', 'type': 'text', 'category': 'personal'},
+    {'name': 'LASTNAME', 'type': 'text', 'category': 'personal'},
+    {'name': 'MIDDLENAME', 'type': 'text', 'category': 'personal'},
+    {'name': 'NICKNAME', 'type': 'text', 'category': 'personal'},
+    
+    # Contact Information
+    {'name': 'EMAIL', 'type': 'text', 'category': 'contact'},
+    {'name': 'SMS', 'type': 'text', 'category': 'contact'},
+    {'name': 'PHONE', 'type': 'text', 'category': 'contact'},
+    {'name': 'MOBILE', 'type': 'text', 'category': 'contact'},
+    {'name': 'FAX', 'type': 'text', 'category': 'contact'},
+    {'name': 'WEBSITE', 'type': 'text', 'category': 'contact'},
+    {'name': 'SKYPE', 'type': 'text', 'category': 'contact'},
+    {'name': 'LINKEDIN', 'type': 'text', 'category': 'contact'},
+    {'name': 'TWITTER', 'type': 'text', 'category': 'contact'},
+    {'name': 'FACEBOOK', 'type': 'text', 'category': 'contact'},
+    {'name': 'INSTAGRAM', 'type': 'text', 'category': 'contact'},
+    {'name': 'YOUTUBE', 'type': 'text', 'category': 'contact'},
+    {'name': 'TIKTOK', 'type': 'text', 'category': 'contact'},
+    
+    # Address Information
+    {'name': 'ADDRESS', 'type': 'text', 'category': 'address'},
+    {'name': 'STREET', 'type': 'text', 'category': 'address'},
+    {'name': 'STREET2', 'type': 'text', 'category': 'address'},
+    {'name': 'CITY', 'type': 'text', 'category': 'address'},
+    {'name': 'ZIP', 'type': 'text', 'category': 'address'},
+    {'name': 'POSTAL_CODE', 'type': 'text', 'category': 'address'},
+    {'name': 'COUNTRY', 'type': 'text', 'category': 'address'},
+    {'name': 'STATE', 'type': 'text', 'category': 'address'},
+    {'name': 'PROVINCE', 'type': 'text', 'category': 'address'},
+    {'name': 'REGION', 'type': 'text', 'category': 'address'},
+    {'name': 'TIMEZONE', 'type': 'text', 'category': 'address'},
+    {'name': 'LATITUDE', 'type': 'number', 'category': 'address'},
+    {'name': 'LONGITUDE', 'type': 'number', 'category': 'address'},
+    
+    # Company Information
+    {'name': 'COMPANY', 'type': 'text', 'category': 'company'},
+    {'name': 'COMPANY_NAME', 'type': 'text', 'category': 'company'},
+    {'name': 'JOB_TITLE', 'type': 'text', 'category': 'company'},
+    {'name': 'POSITION', 'type': 'text', 'category': 'company'},
+    {'name': 'DEPARTMENT', 'type': 'text', 'category': 'company'},
+    {'name': 'INDUSTRY', 'type': 'text', 'category': 'company'},
+    {'name': 'COMPANY_SIZE', 'type': 'text', 'category': 'company'},
+    {'name': 'ANNUAL_REVENUE', 'type': 'number', 'category': 'company'},
+    {'name': 'EMPLOYEES', 'type': 'number', 'category': 'company'},
+    {'name': 'COMPANY_WEBSITE', 'type': 'text', 'category': 'company'},
+    {'name': 'COMPANY_PHONE', 'type': 'text', 'category': 'company'},
+    {'name': 'COMPANY_EMAIL', 'type': 'text', 'category': 'company'},
+    
+    # Marketing & Preferences
+    {'name': 'SOURCE', 'type': 'text', 'category': 'marketing'},
+    {'name': 'LEAD_SOURCE', 'type': 'text', 'category': 'marketing'},
+    {'name': 'CAMPAIGN', 'type': 'text', 'category': 'marketing'},
+    {'name': 'UTM_SOURCE', 'type': 'text', 'category': 'marketing'},
+    {'name': 'UTM_MEDIUM', 'type': 'text', 'category': 'marketing'},
+    {'name': 'UTM_CAMPAIGN', 'type': 'text', 'category': 'marketing'},
+    {'name': 'UTM_TERM', 'type': 'text', 'category': 'marketing'},
+    {'name': 'UTM_CONTENT', 'type': 'text', 'category': 'marketing'},
+    {'name': 'REFERRER', 'type': 'text', 'category': 'marketing'},
+    {'name': 'LANDING_PAGE', 'type': 'text', 'category': 'marketing'},
+    {'name': 'SUBSCRIBER_TYPE', 'type': 'text', 'category': 'marketing'},
+    {'name': 'SUBSCRIPTION_STATUS', 'type': 'text', 'category': 'marketing'},
+    {'name': 'OPT_IN_DATE', 'type': 'datetime', 'category': 'marketing'},
+    {'name': 'OPT_OUT_DATE', 'type': 'datetime', 'category': 'marketing'},
+    {'name': 'LAST_ACTIVITY', 'type': 'datetime', 'category': 'marketing'},
+    {'name': 'LAST_OPEN', 'type': 'datetime', 'category': 'marketing'},
+    {'name': 'LAST_CLICK', 'type': 'datetime', 'category': 'marketing'},
+    {'name': 'EMAIL_FREQUENCY', 'type': 'text', 'category': 'marketing'},
+    {'name': 'PREFERRED_LANGUAGE', 'type': 'text', 'category': 'marketing'},
+    {'name': 'COMMUNICATION_PREFERENCE', 'type': 'text', 'category': 'marketing'},
+    
+    # Custom Fields (common examples)
+    {'name': 'CUSTOM_FIELD_1', 'type': 'text', 'category': 'custom'},
+    {'name': 'CUSTOM_FIELD_2', 'type': 'text', 'category': 'custom'},
+    {'name': 'CUSTOM_FIELD_3', 'type': 'text', 'category': 'custom'},
+    {'name': 'CUSTOM_FIELD_4', 'type': 'text', 'category': 'custom'},
+    {'name': 'CUSTOM_FIELD_5', 'type': 'text', 'category': 'custom'},
+    {'name': 'NOTES', 'type': 'text', 'category': 'custom'},
+    {'name': 'TAGS', 'type': 'text', 'category': 'custom'},
+    {'name': 'SEGMENT', 'type': 'text', 'category': 'custom'},
+    {'name': 'SCORE', 'type': 'number', 'category': 'custom'},
+    {'name': 'PRIORITY', 'type': 'text', 'category': 'custom'},
+    {'name': 'STATUS', 'type': 'text', 'category': 'custom'},
+    {'name': 'STAGE', 'type': 'text', 'category': 'custom'},
+    {'name': 'TYPE', 'type': 'text', 'category': 'custom'},
+    {'name': 'CATEGORY', 'type': 'text', 'category': 'custom'},
+    {'name': 'RATING', 'type': 'number', 'category': 'custom'},
+    {'name': 'SALARY', 'type': 'number', 'category': 'custom'},
+    {'name': 'BUDGET', 'type': 'number', 'category': 'custom'},
+    {'name': 'INTEREST', 'type': 'text', 'category': 'custom'},
+    {'name': 'HOBBY', 'type': 'text', 'category': 'custom'},
+    {'name': 'EDUCATION', 'type': 'text', 'category': 'custom'},
+    {'name': 'EXPERIENCE', 'type': 'text', 'category': 'custom'},
+    {'name': 'SKILLS', 'type': 'text', 'category': 'custom'},
+    {'name': 'CERTIFICATIONS', 'type': 'text', 'category': 'custom'},
+    {'name': 'LANGUAGES', 'type': 'text', 'category': 'custom'},
+    {'name': 'AVAILABILITY', 'type': 'text', 'category': 'custom'},
+    {'name': 'PREFERRED_CONTACT_TIME', 'type': 'text', 'category': 'custom'},
+    {'name': 'PREFERRED_CONTACT_METHOD', 'type': 'text', 'category': 'custom'},
+    {'name': 'CONSENT_DATE', 'type': 'datetime', 'category': 'custom'},
+    {'name': 'CONSENT_SOURCE', 'type': 'text', 'category': 'custom'},
+    {'name': 'CONSENT_TEXT', 'type': 'text', 'category': 'custom'},
+    {'name': 'GDPR_CONSENT', 'type': 'boolean', 'category': 'custom'},
+    {'name': 'MARKETING_CONSENT', 'type': 'boolean', 'category': 'custom'},
+    {'name': 'NEWSLETTER_CONSENT', 'type': 'boolean', 'category': 'custom'},
+    {'name': 'SMS_CONSENT', 'type': 'boolean', 'category': 'custom'},
+    {'name': 'CALL_CONSENT', 'type': 'boolean', 'category': 'custom'},
+    {'name': 'EMAIL_CONSENT', 'type': 'boolean', 'category': 'custom'},
+)
+
 
 class BrevoService:
     """Service class for Brevo API interactions"""
@@ -29,29 +156,33 @@ class BrevoService:
         self.api_key = api_key
         self.configuration = brevo_python.Configuration()
         self.configuration.api_key['api-key'] = api_key
+        # Bounded keep-alive pool: the service instance is shared per API key by all threads of the process
+        self.configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
         
-        # Initialize API clients
-        self.contacts_api = brevo_python.ContactsApi(brevo_python.ApiClient(self.configuration))
+        # Initialize API clients sharing one ApiClient, hence one HTTP connection pool
+        api_client = brevo_python.ApiClient(self.configuration)
+        self.contacts_api = brevo_python.ContactsApi(api_client)
         # Use dedicated ListsApi if available
-        self.lists_api = getattr(brevo_python, 'ListsApi', brevo_python.ContactsApi)(
-            brevo_python.ApiClient(self.configuration)
-        )
-        self.webhooks_api = brevo_python.WebhooksApi(brevo_python.ApiClient(self.configuration))
+        self.lists_api = getattr(brevo_python, 'ListsApi', brevo_python.ContactsApi)(api_client)
+        self.webhooks_api = brevo_python.WebhooksApi(api_client)
         
         # Rate limiting
         self.last_request_time = 0
-        self.min_request_interval = 0.2  # 200ms between requests (300 requests/minute)
+        self.min_request_interval = MIN_REQUEST_INTERVAL
+        # Requests may be issued from several threads; the spacing must hold across all of them
+        self._rate_limit_lock = threading.Lock()
     
     def _rate_limit(self):
         """Implement rate limiting"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
+        with self._rate_limit_lock:
+            current_time = time.time()
+            time_since_last = current_time - self.last_request_time
+            
+            if time_since_last < self.min_request_interval:
+                sleep_time = self.min_request_interval - time_since_last
+                time.sleep(sleep_time)
+            
+            self.last_request_time = time.time()
     
     def test_connection(self) -> Dict[str, Any]:
         """Test the connection to Brevo API"""
@@ -90,7 +221,7 @@ class BrevoService:
                     }
                     
         except Exception as e:
-            _logger.error(f"Brevo connection test failed: {str(e)}")
+            _logger.error("Brevo connection test failed: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -116,14 +247,14 @@ class BrevoService:
                 'data': response,
             }
         except ApiException as e:
-            _logger.error(f"Failed to create Brevo contact: {e}")
+            _logger.error("Failed to create Brevo contact: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
                 'details': e.body if hasattr(e, 'body') else str(e),
             }
         except Exception as e:
-            _logger.error(f"Failed to create Brevo contact: {str(e)}")
+            _logger.error("Failed to create Brevo contact: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -146,14 +277,14 @@ class BrevoService:
                 'data': response,
             }
         except ApiException as e:
-            _logger.error(f"Failed to update Brevo contact: {e}")
+            _logger.error("Failed to update Brevo contact: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
                 'details': e.body if hasattr(e, 'body') else str(e),
             }
         except Exception as e:
-            _logger.error(f"Failed to update Brevo contact: {str(e)}")
+            _logger.error("Failed to update Brevo contact: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -176,13 +307,13 @@ class BrevoService:
                     'success': False,
                     'error': 'Contact not found',
                 }
-            _logger.error(f"Failed to get Brevo contact: {e}")
+            _logger.error("Failed to get Brevo contact: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to get Brevo contact: {str(e)}")
+            _logger.error("Failed to get Brevo contact: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -205,13 +336,13 @@ class BrevoService:
                     'success': False,
                     'error': 'Contact not found',
                 }
-            _logger.error(f"Failed to get Brevo contact by email: {e}")
+            _logger.error("Failed to get Brevo contact by email: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to get Brevo contact by email: {str(e)}")
+            _logger.error("Failed to get Brevo contact by email: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -228,13 +359,13 @@ class BrevoService:
                 'success': True,
             }
         except ApiException as e:
-            _logger.error(f"Failed to delete Brevo contact: {e}")
+            _logger.error("Failed to delete Brevo contact: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to delete Brevo contact: {str(e)}")
+            _logger.error("Failed to delete Brevo contact: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -259,7 +390,7 @@ class BrevoService:
                 )
             except Exception as e:
                 # Try without modified_since parameter
-                _logger.warning(f"get_contacts with modified_since failed, trying without: {e}")
+                _logger.warning("get_contacts with modified_since failed, trying without: %s", e)
                 response = self.contacts_api.get_contacts(
                     limit=limit,
                     offset=offset
@@ -289,13 +420,13 @@ class BrevoService:
                 'count': count,
             }
         except ApiException as e:
-            _logger.error(f"Failed to get Brevo contacts: {e}")
+            _logger.error("Failed to get Brevo contacts: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to get Brevo contacts: {str(e)}")
+            _logger.error("Failed to get Brevo contacts: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -320,14 +451,14 @@ class BrevoService:
                 'data': response,
             }
         except ApiException as e:
-            _logger.error(f"Failed to create Brevo list: {e}")
+            _logger.error("Failed to create Brevo list: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
                 'details': e.body if hasattr(e, 'body') else str(e),
             }
         except Exception as e:
-            _logger.error(f"Failed to create Brevo list: {str(e)}")
+            _logger.error("Failed to create Brevo list: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -346,13 +477,13 @@ class BrevoService:
                 'count': response.count,
             }
         except ApiException as e:
-            _logger.error(f"Failed to get Brevo lists: {e}")
+            _logger.error("Failed to get Brevo lists: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to get Brevo lists: {str(e)}")
+            _logger.error("Failed to get Brevo lists: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -375,13 +506,13 @@ class BrevoService:
                     'success': False,
                     'error': 'List not found',
                 }
-            _logger.error(f"Failed to get Brevo list: {e}")
+            _logger.error("Failed to get Brevo list: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to get Brevo list: {str(e)}")
+            _logger.error("Failed to get Brevo list: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -403,13 +534,13 @@ class BrevoService:
                 'data': response,
             }
         except ApiException as e:
-            _logger.error(f"Failed to add contacts to Brevo list: {e}")
+            _logger.error("Failed to add contacts to Brevo list: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to add contacts to Brevo list: {str(e)}")
+            _logger.error("Failed to add contacts to Brevo list: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -431,13 +562,13 @@ class BrevoService:
                 'data': response,
             }
         except ApiException as e:
-            _logger.error(f"Failed to remove contacts from Brevo list: {e}")
+            _logger.error("Failed to remove contacts from Brevo list: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to remove contacts from Brevo list: {str(e)}")
+            _logger.error("Failed to remove contacts from Brevo list: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -463,13 +594,13 @@ class BrevoService:
                 'data': response,
             }
         except ApiException as e:
-            _logger.error(f"Failed to create Brevo webhook: {e}")
+            _logger.error("Failed to create Brevo webhook: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to create Brevo webhook: {str(e)}")
+            _logger.error("Failed to create Brevo webhook: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -487,13 +618,13 @@ class BrevoService:
                 'webhooks': response.webhooks,
             }
         except ApiException as e:
-            _logger.error(f"Failed to get Brevo webhooks: {e}")
+            _logger.error("Failed to get Brevo webhooks: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to get Brevo webhooks: {str(e)}")
+            _logger.error("Failed to get Brevo webhooks: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -510,13 +641,13 @@ class BrevoService:
                 'success': True,
             }
         except ApiException as e:
-            _logger.error(f"Failed to delete Brevo webhook: {e}")
+            _logger.error("Failed to delete Brevo webhook: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to delete Brevo webhook: {str(e)}")
+            _logger.error("Failed to delete Brevo webhook: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -539,13 +670,13 @@ class BrevoService:
                     'tags': []
                 }
         except ApiException as e:
-            _logger.error(f"Failed to get contact tags: {e}")
+            _logger.error("Failed to get contact tags: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to get contact tags: {str(e)}")
+            _logger.error("Failed to get contact tags: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -567,139 +698,33 @@ class BrevoService:
                 'message': 'Contact tags updated successfully'
             }
         except ApiException as e:
-            _logger.error(f"Failed to update contact tags: {e}")
+            _logger.error("Failed to update contact tags: %s", e)
             return {
                 'success': False,
                 'error': f"API Error {e.status}: {e.reason}",
             }
         except Exception as e:
-            _logger.error(f"Failed to update contact tags: {str(e)}")
+            _logger.error("Failed to update contact tags: %s", e)
             return {
                 'success': False,
                 'error': str(e),
             }
     
+    def iter_contact_attributes(self) -> Iterator[Dict[str, Any]]:
+        """Yield the available Brevo contact attributes one by one"""
+        # Note: AttributesApi not available in current brevo-python version
+        # For now, yield the comprehensive list of standard Brevo attributes
+        yield from CONTACT_ATTRIBUTES
+
     def get_all_contact_attributes(self) -> Dict[str, Any]:
         """Get all available contact attributes from Brevo"""
-        # Note: AttributesApi not available in current brevo-python version
-        # For now, return comprehensive list of standard Brevo attributes
         return {
             'success': True,
-            'attributes': [
-                # Personal Information
-                {'name': 'FNAME', 'type': 'text', 'category': 'personal'},
-                {'name': 'LNAME', 'type': 'text', 'category': 'personal'},
-                {'name': 'BIRTHDAY', 'type': 'date', 'category': 'personal'},
-                {'name': 'AGE', 'type': 'number', 'category': 'personal'},
-                {'name': 'GENDER', 'type': 'text', 'category': 'personal'},
-                {'name': 'TITLE', 'type': 'text', 'category': 'personal'},
-                {'name': 'FIRSTNAME', 'type': 'text', 'category': 'personal'},
-                {'name': 'LASTNAME', 'type': 'text', 'category': 'personal'},
-                {'name': 'MIDDLENAME', 'type': 'text', 'category': 'personal'},
-                {'name': 'NICKNAME', 'type': 'text', 'category': 'personal'},
-                
-                # Contact Information
-                {'name': 'EMAIL', 'type': 'text', 'category': 'contact'},
-                {'name': 'SMS', 'type': 'text', 'category': 'contact'},
-                {'name': 'PHONE', 'type': 'text', 'category': 'contact'},
-                {'name': 'MOBILE', 'type': 'text', 'category': 'contact'},
-                {'name': 'FAX', 'type': 'text', 'category': 'contact'},
-                {'name': 'WEBSITE', 'type': 'text', 'category': 'contact'},
-                {'name': 'SKYPE', 'type': 'text', 'category': 'contact'},
-                {'name': 'LINKEDIN', 'type': 'text', 'category': 'contact'},
-                {'name': 'TWITTER', 'type': 'text', 'category': 'contact'},
-                {'name': 'FACEBOOK', 'type': 'text', 'category': 'contact'},
-                {'name': 'INSTAGRAM', 'type': 'text', 'category': 'contact'},
-                {'name': 'YOUTUBE', 'type': 'text', 'category': 'contact'},
-                {'name': 'TIKTOK', 'type': 'text', 'category': 'contact'},
-                
-                # Address Information
-                {'name': 'ADDRESS', 'type': 'text', 'category': 'address'},
-                {'name': 'STREET', 'type': 'text', 'category': 'address'},
-                {'name': 'STREET2', 'type': 'text', 'category': 'address'},
-                {'name': 'CITY', 'type': 'text', 'category': 'address'},
-                {'name': 'ZIP', 'type': 'text', 'category': 'address'},
-                {'name': 'POSTAL_CODE', 'type': 'text', 'category': 'address'},
-                {'name': 'COUNTRY', 'type': 'text', 'category': 'address'},
-                {'name': 'STATE', 'type': 'text', 'category': 'address'},
-                {'name': 'PROVINCE', 'type': 'text', 'category': 'address'},
-                {'name': 'REGION', 'type': 'text', 'category': 'address'},
-                {'name': 'TIMEZONE', 'type': 'text', 'category': 'address'},
-                {'name': 'LATITUDE', 'type': 'number', 'category': 'address'},
-                {'name': 'LONGITUDE', 'type': 'number', 'category': 'address'},
-                
-                # Company Information
-                {'name': 'COMPANY', 'type': 'text', 'category': 'company'},
-                {'name': 'COMPANY_NAME', 'type': 'text', 'category': 'company'},
-                {'name': 'JOB_TITLE', 'type': 'text', 'category': 'company'},
-                {'name': 'POSITION', 'type': 'text', 'category': 'company'},
-                {'name': 'DEPARTMENT', 'type': 'text', 'category': 'company'},
-                {'name': 'INDUSTRY', 'type': 'text', 'category': 'company'},
-                {'name': 'COMPANY_SIZE', 'type': 'text', 'category': 'company'},
-                {'name': 'ANNUAL_REVENUE', 'type': 'number', 'category': 'company'},
-                {'name': 'EMPLOYEES', 'type': 'number', 'category': 'company'},
-                {'name': 'COMPANY_WEBSITE', 'type': 'text', 'category': 'company'},
-                {'name': 'COMPANY_PHONE', 'type': 'text', 'category': 'company'},
-                {'name': 'COMPANY_EMAIL', 'type': 'text', 'category': 'company'},
-                
-                # Marketing & Preferences
-                {'name': 'SOURCE', 'type': 'text', 'category': 'marketing'},
-                {'name': 'LEAD_SOURCE', 'type': 'text', 'category': 'marketing'},
-                {'name': 'CAMPAIGN', 'type': 'text', 'category': 'marketing'},
-                {'name': 'UTM_SOURCE', 'type': 'text', 'category': 'marketing'},
-                {'name': 'UTM_MEDIUM', 'type': 'text', 'category': 'marketing'},
-                {'name': 'UTM_CAMPAIGN', 'type': 'text', 'category': 'marketing'},
-                {'name': 'UTM_TERM', 'type': 'text', 'category': 'marketing'},
-                {'name': 'UTM_CONTENT', 'type': 'text', 'category': 'marketing'},
-                {'name': 'REFERRER', 'type': 'text', 'category': 'marketing'},
-                {'name': 'LANDING_PAGE', 'type': 'text', 'category': 'marketing'},
-                {'name': 'SUBSCRIBER_TYPE', 'type': 'text', 'category': 'marketing'},
-                {'name': 'SUBSCRIPTION_STATUS', 'type': 'text', 'category': 'marketing'},
-                {'name': 'OPT_IN_DATE', 'type': 'datetime', 'category': 'marketing'},
-                {'name': 'OPT_OUT_DATE', 'type': 'datetime', 'category': 'marketing'},
-                {'name': 'LAST_ACTIVITY', 'type': 'datetime', 'category': 'marketing'},
-                {'name': 'LAST_OPEN', 'type': 'datetime', 'category': 'marketing'},
-                {'name': 'LAST_CLICK', 'type': 'datetime', 'category': 'marketing'},
-                {'name': 'EMAIL_FREQUENCY', 'type': 'text', 'category': 'marketing'},
-                {'name': 'PREFERRED_LANGUAGE', 'type': 'text', 'category': 'marketing'},
-                {'name': 'COMMUNICATION_PREFERENCE', 'type': 'text', 'category': 'marketing'},
-                
-                # Custom Fields (common examples)
-                {'name': 'CUSTOM_FIELD_1', 'type': 'text', 'category': 'custom'},
-                {'name': 'CUSTOM_FIELD_2', 'type': 'text', 'category': 'custom'},
-                {'name': 'CUSTOM_FIELD_3', 'type': 'text', 'category': 'custom'},
-                {'name': 'CUSTOM_FIELD_4', 'type': 'text', 'category': 'custom'},
-                {'name': 'CUSTOM_FIELD_5', 'type': 'text', 'category': 'custom'},
-                {'name': 'NOTES', 'type': 'text', 'category': 'custom'},
-                {'name': 'TAGS', 'type': 'text', 'category': 'custom'},
-                {'name': 'SEGMENT', 'type': 'text', 'category': 'custom'},
-                {'name': 'SCORE', 'type': 'number', 'category': 'custom'},
-                {'name': 'PRIORITY', 'type': 'text', 'category': 'custom'},
-                {'name': 'STATUS', 'type': 'text', 'category': 'custom'},
-                {'name': 'STAGE', 'type': 'text', 'category': 'custom'},
-                {'name': 'TYPE', 'type': 'text', 'category': 'custom'},
-                {'name': 'CATEGORY', 'type': 'text', 'category': 'custom'},
-                {'name': 'RATING', 'type': 'number', 'category': 'custom'},
-                {'name': 'SALARY', 'type': 'number', 'category': 'custom'},
-                {'name': 'BUDGET', 'type': 'number', 'category': 'custom'},
-                {'name': 'INTEREST', 'type': 'text', 'category': 'custom'},
-                {'name': 'HOBBY', 'type': 'text', 'category': 'custom'},
-                {'name': 'EDUCATION', 'type': 'text', 'category': 'custom'},
-                {'name': 'EXPERIENCE', 'type': 'text', 'category': 'custom'},
-                {'name': 'SKILLS', 'type': 'text', 'category': 'custom'},
-                {'name': 'CERTIFICATIONS', 'type': 'text', 'category': 'custom'},
-                {'name': 'LANGUAGES', 'type': 'text', 'category': 'custom'},
-                {'name': 'AVAILABILITY', 'type': 'text', 'category': 'custom'},
-                {'name': 'PREFERRED_CONTACT_TIME', 'type': 'text', 'category': 'custom'},
-                {'name': 'PREFERRED_CONTACT_METHOD', 'type': 'text', 'category': 'custom'},
-                {'name': 'CONSENT_DATE', 'type': 'datetime', 'category': 'custom'},
-                {'name': 'CONSENT_SOURCE', 'type': 'text', 'category': 'custom'},
-                {'name': 'CONSENT_TEXT', 'type': 'text', 'category': 'custom'},
-                {'name': 'GDPR_CONSENT', 'type': 'boolean', 'category': 'custom'},
-                {'name': 'MARKETING_CONSENT', 'type': 'boolean', 'category': 'custom'},
-                {'name': 'NEWSLETTER_CONSENT', 'type': 'boolean', 'category': 'custom'},
-                {'name': 'SMS_CONSENT', 'type': 'boolean', 'category': 'custom'},
-                {'name': 'CALL_CONSENT', 'type': 'boolean', 'category': 'custom'},
-                {'name': 'EMAIL_CONSENT', 'type': 'boolean', 'category': 'custom'},
-            ]
+            'attributes': list(self.iter_contact_attributes()),
         }
+
+
+@functools.lru_cache(maxsize=8)
+def get_brevo_service(api_key: str) -> BrevoService:
+    """Return a shared BrevoService for the API key so its HTTP connection pool is reused"""
+    return BrevoService(api_key)
@@ -2,16 +2,59 @@
 
 import logging
 import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
 from odoo import api, models, fields, _
 from odoo.exceptions import ValidationError, UserError
 
-from .brevo_service import BrevoService
+from .brevo_service import MIN_REQUEST_INTERVAL, get_brevo_service
 
 _logger = logging.getLogger(__name__)
 
+# Wall-clock time a contact sync batch should take; the batch size adapts towards it
+BATCH_TARGET_SECONDS = 20.0
+
+# Typical round-trip of a per-contact Brevo request
+FETCH_LATENCY_SECONDS = 0.5
+
+# Concurrent Brevo requests when fetching per-contact data (tags, attributes). The rate limit
+# serialises request starts one MIN_REQUEST_INTERVAL apart, so concurrency only covers the
+# round-trip: latency x allowed rate (0.5 s x 5 req/s = 3); more workers just queue on the lock
+FETCH_WORKERS = max(1, math.ceil(FETCH_LATENCY_SECONDS / MIN_REQUEST_INTERVAL))
+
+# Context for records written by a sync: no chatter messages or field tracking per record
+SYNC_CONTEXT = {
+    'tracking_disable': True,
+    'mail_create_nolog': True,
+    'mail_notrack': True,
+}
+
+
+def parse_brevo_datetime(date_string):
+    """Parse Brevo datetime string to Odoo datetime format"""
+    if not date_string:
+        return None
+
+    try:
+        # Handle different Brevo datetime formats
+        if 'T' in date_string:
+            # ISO format with timezone
+            if '+' in date_string or 'Z' in date_string:
+                # Remove timezone info for Odoo
+                date_string = date_string.split('+')[0].split('Z')[0]
+            # Parse ISO format
+            return datetime.fromisoformat(date_string.replace('T', ' '))
+        else:
+            # Simple date format
+            return datetime.strptime(date_string, '%Y-%m-%d')
+    except Exception as e:
+        _logger.warning("Failed to parse datetime '%s': %s", date_string, e)
+        return None
+
 
 class BrevoSyncService:
     """Service for synchronizing data between Odoo and Brevo"""
@@ -19,29 +62,12 @@ class BrevoSyncService:
     def __init__(self, config):
         """Initialize sync service with Brevo configuration"""
         self.config = config
-        self.brevo_service = BrevoService(config.api_key)
-        self.env = config.env
+        self.brevo_service = get_brevo_service(config.api_key)
+        self.env = config.with_context(**SYNC_CONTEXT).env
     
     def _parse_brevo_datetime(self, date_string):
         """Parse Brevo datetime string to Odoo datetime format"""
-        if not date_string:
-            return None
-        
-        try:
-            # Handle different Brevo datetime formats
-            if 'T' in date_string:
-                # ISO format with timezone
-                if '+' in date_string or 'Z' in date_string:
-                    # Remove timezone info for Odoo
-                    date_string = date_string.split('+')[0].split('Z')[0]
-                # Parse ISO format
-                return datetime.fromisoformat(date_string.replace('T', ' '))
-            else:
-                # Simple date format
-                return datetime.strptime(date_string, '%Y-%m-%d')
-        except Exception as e:
-            _logger.warning(f"Failed to parse datetime '{date_string}': {str(e)}")
-            return None
+        return parse_brevo_datetime(date_string)
     
     def sync_contacts(self) -> Dict[str, Any]:
         """Synchronize contacts between Odoo and Brevo"""
@@ -49,12 +75,19 @@ class BrevoSyncService:
             _logger.info("Starting contact synchronization...")
             
             # Get contacts from Brevo in batches
-            batch_size = self.config.batch_size or 100
+            # batch_size is the cap; the effective size adapts to the observed batch duration
+            max_batch_size = self.config.batch_size or 100
+            batch_size = max_batch_size
+            batch_number = 0
             offset = 0
             total_synced = 0
             total_errors = 0
+            # One sync timestamp for every partner touched by this run
+            now = fields.Datetime.now()
             
             while True:
+                batch_start = time.monotonic()
+                batch_number += 1
                 # Get batch of contacts from Brevo
                 brevo_contacts_result = self.brevo_service.get_contacts(limit=batch_size, offset=offset)
                 if not brevo_contacts_result.get('success'):
@@ -64,7 +97,7 @@ class BrevoSyncService:
                 if not brevo_contacts:
                     break  # No more contacts
                 
-                _logger.info(f"Processing batch {offset//batch_size + 1}: {len(brevo_contacts)} contacts")
+                _logger.info("Processing batch %s: %s contacts", batch_number, len(brevo_contacts))
                 
                 batch_synced = 0
                 batch_errors = 0
@@ -81,19 +114,19 @@ class BrevoSyncService:
                         
                         if partner:
                             # Update existing partner
-                            self._update_partner_from_brevo(partner, brevo_contact)
-                            _logger.info(f"Updated partner: {partner.display_name}")
+                            self._update_partner_from_brevo(partner, brevo_contact, now=now)
+                            _logger.info("Updated partner: %s", partner.display_name)
                         else:
                             # Create new partner
-                            partner = self._create_partner_from_brevo(brevo_contact)
+                            partner = self._create_partner_from_brevo(brevo_contact, now=now)
                             if partner:
-                                _logger.info(f"Created new partner: {partner.display_name}")
+                                _logger.info("Created new partner: %s", partner.display_name)
                         
                         batch_synced += 1
                         
                     except Exception as e:
                         batch_errors += 1
-                        _logger.error(f"Failed to sync contact {brevo_contact.get('email', 'unknown')}: {str(e)}")
+                        _logger.error("Failed to sync contact %s: %s", brevo_contact.get('email', 'unknown'), e)
                         self.env['brevo.sync.log'].log_error(
                             'sync_contact', 'brevo_to_odoo', f"Failed to sync contact {brevo_contact.get('email', 'unknown')}",
                             error_message=str(e), brevo_id=brevo_contact.get('id'), config_id=self.config.id
@@ -101,19 +134,15 @@ class BrevoSyncService:
                 
                 total_synced += batch_synced
                 total_errors += batch_errors
-                offset += batch_size
+                offset += len(brevo_contacts)
                 
                 # Log batch progress
-                _logger.info(f"Batch completed: {batch_synced} synced, {batch_errors} errors")
+                _logger.info("Batch completed: %s synced, %s errors", batch_synced, batch_errors)
                 
                 # Break if we got fewer contacts than requested (end of data)
                 if len(brevo_contacts) < batch_size:
                     break
-            
-            # Update sync status
-            self.config.last_sync_contacts = fields.Datetime.now()
-            self.config.sync_status = 'success'
-            self.config.error_message = False
+                batch_size = self._next_batch_size(batch_size, time.monotonic() - batch_start, max_batch_size)
             
             message = f"Contact sync completed. Total synced: {total_synced}, Total errors: {total_errors}"
             _logger.info(message)
@@ -126,12 +155,19 @@ class BrevoSyncService:
             }
             
         except Exception as e:
-            _logger.error(f"Contact sync failed: {str(e)}")
-            self.config.sync_status = 'error'
-            self.config.error_message = str(e)
+            _logger.error("Contact sync failed: %s", e)
             return {'success': False, 'error': str(e)}
     
-    def _create_partner_from_brevo(self, brevo_contact):
+    def _next_batch_size(self, batch_size, duration, max_batch_size):
+        """Adapt the batch size to the last batch duration: grow when fast, shrink when slow"""
+        efficiency = duration / BATCH_TARGET_SECONDS
+        if efficiency < 0.9:
+            batch_size = max(batch_size + 1, int(batch_size * 1.2))
+        elif efficiency > 0.95:
+            batch_size = int(batch_size * 0.8)
+        return max(1, min(batch_size, max_batch_size))
+
+    def _create_partner_from_brevo(self, brevo_contact, now=None):
         """Create a new partner from Brevo contact data"""
         try:
             email = brevo_contact.get('email')
@@ -146,15 +182,15 @@ class BrevoSyncService:
             combined_name = f"{fname} {lname}".strip()
             partner_name = combined_name or email
             
-            _logger.info(f"Creating partner from Brevo: email={email}, VORNAME='{fname}', NACHNAME='{lname}', combined_name='{combined_name}', final_name='{partner_name}'")
-            _logger.info(f"Available attributes: {list(attributes.keys())}")
+            _logger.info("Creating partner from Brevo: email=%s, VORNAME='%s', NACHNAME='%s', combined_name='%s', final_name='%s'", email, fname, lname, combined_name, partner_name)
+            _logger.info("Available attributes: %s", list(attributes.keys()))
             
             partner_vals = {
                 'name': partner_name,
                 'email': email,
                 'brevo_id': str(brevo_contact.get('id')),
                 'brevo_sync_status': 'synced',
-                'brevo_last_sync': fields.Datetime.now(),
+                'brevo_last_sync': now or fields.Datetime.now(),
                 'brevo_created_date': self._parse_brevo_datetime(brevo_contact.get('createdAt')),
                 'brevo_modified_date': self._parse_brevo_datetime(brevo_contact.get('modifiedAt')),
                 'mobile': attributes.get('SMS', ''),
@@ -223,10 +259,10 @@ class BrevoSyncService:
             return partner
             
         except Exception as e:
-            _logger.error(f"Failed to create partner from Brevo contact: {str(e)}")
+            _logger.error("Failed to create partner from Brevo contact: %s", e)
             return None
     
-    def _update_partner_from_brevo(self, partner, brevo_contact):
+    def _update_partner_from_brevo(self, partner, brevo_contact, now=None):
         """Update existing partner with Brevo contact data"""
         try:
             attributes = brevo_contact.get('attributes', {})
@@ -235,7 +271,7 @@ class BrevoSyncService:
             update_vals = {
                 'brevo_id': str(brevo_contact.get('id')),
                 'brevo_sync_status': 'synced',
-                'brevo_last_sync': fields.Datetime.now(),
+                'brevo_last_sync': now or fields.Datetime.now(),
                 'brevo_modified_date': self._parse_brevo_datetime(brevo_contact.get('modifiedAt')),
             }
             
@@ -249,8 +285,8 @@ class BrevoSyncService:
                 lname = attributes.get('NACHNAME', '') or attributes.get('LNAME', '') or attributes.get('LASTNAME', '')
                 combined_name = f"{fname} {lname}".strip()
                 
-                _logger.info(f"Updating partner name from Brevo: email={partner.email}, current_name='{partner.name}', VORNAME='{fname}', NACHNAME='{lname}', combined_name='{combined_name}'")
-                _logger.info(f"Available attributes: {list(attributes.keys())}")
+                _logger.info("Updating partner name from Brevo: email=%s, current_name='%s', VORNAME='%s', NACHNAME='%s', combined_name='%s'", partner.email, partner.name, fname, lname, combined_name)
+                _logger.info("Available attributes: %s", list(attributes.keys()))
                 
                 if combined_name:
                     update_vals['name'] = combined_name
@@ -326,7 +362,7 @@ class BrevoSyncService:
             )
             
         except Exception as e:
-            _logger.error(f"Failed to update partner from Brevo contact: {str(e)}")
+            _logger.error("Failed to update partner from Brevo contact: %s", e)
             raise e
 
     def _apply_attribute_mappings_to_vals(self, attributes: Dict[str, Any], vals: Dict[str, Any], partner=None) -> None:
@@ -373,7 +409,7 @@ class BrevoSyncService:
                 vals[odoo_field] = converted
 
         except Exception as map_exc:
-            _logger.warning(f"Failed to apply attribute mappings: {str(map_exc)}")
+            _logger.warning("Failed to apply attribute mappings: %s", map_exc)
 
     def _convert_brevo_value_for_field(self, value: Any, field_def) -> Any:
         """Convert Brevo attribute value to match the Odoo field type.
@@ -418,6 +454,8 @@ class BrevoSyncService:
     def sync_partner_to_brevo(self, partner) -> Dict[str, Any]:
         """Sync a single partner to Brevo"""
         try:
+            # Read only the columns this sync uses instead of every stored column of the wide partner model
+            partner = partner.with_context(prefetch_fields=False)
             if not partner.email:
                 return {'success': False, 'error': 'Partner has no email address'}
             
@@ -426,6 +464,11 @@ class BrevoSyncService:
                 ('active', '=', True),
                 ('company_id', '=', self.config.company_id.id)
             ])
+            # Load the mapped fields in one query
+            partner.fetch(
+                ['brevo_id', 'category_id', 'brevo_dynamic_fields']
+                + [name for name in field_mappings.mapped('odoo_field_name') if name in partner._fields]
+            )
             
             # Prepare Brevo contact data
             brevo_contact_data = {
@@ -440,18 +483,21 @@ class BrevoSyncService:
                     if value is not None:
                         brevo_contact_data['attributes'][mapping.brevo_field_name] = value
                 except Exception as e:
-                    _logger.warning(f"Failed to map field {mapping.brevo_field_name}: {str(e)}")
+                    _logger.warning("Failed to map field %s: %s", mapping.brevo_field_name, e)
                     continue
             
             # Handle partner categories (map to Brevo lists)
             if partner.category_id:
+                # Find the corresponding Brevo lists of all categories at once (first list per category)
+                list_by_category = {}
+                for brevo_list in self.env['brevo.contact.list'].search([
+                    ('partner_category_id', 'in', partner.category_id.ids),
+                    ('company_id', '=', self.config.company_id.id)
+                ]):
+                    list_by_category.setdefault(brevo_list.partner_category_id.id, brevo_list)
                 brevo_list_ids = []
                 for category in partner.category_id:
-                    # Find corresponding Brevo list
-                    brevo_list = self.env['brevo.contact.list'].search([
-                        ('partner_category_id', '=', category.id),
-                        ('company_id', '=', self.config.company_id.id)
-                    ], limit=1)
+                    brevo_list = list_by_category.get(category.id)
                     if brevo_list and brevo_list.brevo_id:
                         brevo_list_ids.append(int(brevo_list.brevo_id))
                 
@@ -468,11 +514,13 @@ class BrevoSyncService:
             
             if result.get('success'):
                 # Update partner with Brevo ID
+                sync_vals = {
+                    'brevo_sync_status': 'synced',
+                    'brevo_last_sync': fields.Datetime.now(),
+                }
                 if not partner.brevo_id and result.get('contact_id'):
-                    partner.brevo_id = str(result.get('contact_id'))
-                
-                partner.brevo_sync_status = 'synced'
-                partner.brevo_last_sync = fields.Datetime.now()
+                    sync_vals['brevo_id'] = str(result.get('contact_id'))
+                partner.write(sync_vals)
                 
                 # Log success
                 self.env['brevo.sync.log'].log_success(
@@ -490,7 +538,7 @@ class BrevoSyncService:
                 return {'success': False, 'error': result.get('error')}
                 
         except Exception as e:
-            _logger.error(f"Partner sync failed: {str(e)}")
+            _logger.error("Partner sync failed: %s", e)
             return {'success': False, 'error': str(e)}
     
     def sync_lead_to_brevo(self, lead) -> Dict[str, Any]:
@@ -500,7 +548,7 @@ class BrevoSyncService:
             # This would contain the existing lead sync logic
             return {'success': True, 'message': 'Lead synchronized successfully'}
         except Exception as e:
-            _logger.error(f"Lead sync failed: {str(e)}")
+            _logger.error("Lead sync failed: %s", e)
             return {'success': False, 'error': str(e)}
     
     def sync_list_to_brevo(self, contact_list) -> Dict[str, Any]:
@@ -510,7 +558,7 @@ class BrevoSyncService:
             # This would contain the existing list sync logic
             return {'success': True, 'message': 'Contact list synchronized successfully'}
         except Exception as e:
-            _logger.error(f"Contact list sync failed: {str(e)}")
+            _logger.error("Contact list sync failed: %s", e)
             return {'success': False, 'error': str(e)}
     
     def sync_lists(self) -> Dict[str, Any]:
@@ -524,87 +572,32 @@ class BrevoSyncService:
                 raise Exception(f"Failed to get lists from Brevo: {brevo_lists_result.get('error')}")
             
             brevo_lists = brevo_lists_result.get('lists', [])
-            _logger.info(f"Found {len(brevo_lists)} lists in Brevo")
+            _logger.info("Found %s lists in Brevo", len(brevo_lists))
             
-            synced_count = 0
-            error_count = 0
+            ContactList = self.env['brevo.contact.list']
+            company_id = self.config.company_id.id
             
-            # Process each Brevo list
+            # Reject unusable payloads up front so the bulk update and create only get valid lists
+            valid_lists = []
+            error_count = 0
             for brevo_list in brevo_lists:
-                try:
-                    list_id = brevo_list.get('id')
-                    list_name = brevo_list.get('name')
-                    
-                    if not list_id or not list_name:
-                        continue
-                    
-                    # Check if category already exists
-                    category = self.env['res.partner.category'].search([
-                        ('name', '=', list_name)
-                    ], limit=1)
-                    
-                    if not category:
-                        # Create new category
-                        category = self.env['res.partner.category'].create({
-                            'name': list_name,
-                        })
-                        _logger.info(f"Created new category: {list_name}")
-                    else:
-                        _logger.info(f"Category already exists: {list_name}")
-                    
-                    # Create or update brevo.contact.list record
-                    brevo_list_record = self.env['brevo.contact.list'].search([
-                        ('brevo_id', '=', str(list_id)),
-                        ('company_id', '=', self.config.company_id.id)
-                    ], limit=1)
-                    
-                    if not brevo_list_record:
-                        brevo_list_record = self.env['brevo.contact.list'].create({
-                            'name': list_name,
-                            'brevo_id': str(list_id),
-                            'partner_category_id': category.id,
-                            'unique_subscribers': brevo_list.get('uniqueSubscribers', 0),
-                            'total_blacklisted': brevo_list.get('totalBlacklisted', 0),
-                            'total_unsubscribers': brevo_list.get('totalUnsubscribers', 0),
-                            'description': brevo_list.get('description', ''),
-                            'folder_id': str(brevo_list.get('folderId', '')),
-                            'created_at': self._parse_brevo_datetime(brevo_list.get('createdAt')),
-                            'updated_at': self._parse_brevo_datetime(brevo_list.get('updatedAt')),
-                            'sync_status': 'synced',
-                            'last_sync': fields.Datetime.now(),
-                            'company_id': self.config.company_id.id,
-                        })
-                        _logger.info(f"Created brevo.contact.list record: {list_name}")
-                    else:
-                        # Update existing record
-                        brevo_list_record.write({
-                            'name': list_name,
-                            'partner_category_id': category.id,
-                            'unique_subscribers': brevo_list.get('uniqueSubscribers', 0),
-                            'total_blacklisted': brevo_list.get('totalBlacklisted', 0),
-                            'total_unsubscribers': brevo_list.get('totalUnsubscribers', 0),
-                            'description': brevo_list.get('description', ''),
-                            'folder_id': str(brevo_list.get('folderId', '')),
-                            'updated_at': self._parse_brevo_datetime(brevo_list.get('updatedAt')),
-                            'sync_status': 'synced',
-                            'last_sync': fields.Datetime.now(),
-                        })
-                        _logger.info(f"Updated brevo.contact.list record: {list_name}")
-                    
-                    synced_count += 1
-                    
-                except Exception as e:
-                    error_count += 1
-                    _logger.error(f"Failed to sync list {brevo_list.get('name', 'unknown')}: {str(e)}")
-                    self.env['brevo.sync.log'].log_error(
-                        'sync_list', 'brevo_to_odoo', f"Failed to sync list {brevo_list.get('name', 'unknown')}",
-                        error_message=str(e), brevo_id=brevo_list.get('id'), config_id=self.config.id
-                    )
+                if brevo_list.get('id') and brevo_list.get('name'):
+                    valid_lists.append(brevo_list)
+                    continue
+                error_count += 1
+                _logger.error("Skipping Brevo list without id or name: %s", brevo_list)
+                self.env['brevo.sync.log'].log_error(
+                    'sync_list', 'brevo_to_odoo', f"Failed to sync list {brevo_list.get('name', 'unknown')}",
+                    error_message='Brevo list has no id or name', brevo_id=brevo_list.get('id'), config_id=self.config.id
+                )
             
-            # Update sync status
-            self.config.last_sync_lists = fields.Datetime.now()
-            self.config.sync_status = 'success'
-            self.config.error_message = False
+            # Update the lists Odoo already knows in bulk, then create the new ones in one batch
+            updated_lists = ContactList.bulk_update_from_brevo_data(valid_lists, company_id=company_id)
+            created_lists = ContactList.create_many_from_brevo_data(
+                valid_lists, company_id=company_id, existing_ids=set(updated_lists.mapped('brevo_id'))
+            )
+            _logger.info("Updated %s and created %s brevo.contact.list records", len(updated_lists), len(created_lists))
+            synced_count = len(updated_lists) + len(created_lists)
             
             message = f"List sync completed. Synced: {synced_count}, Errors: {error_count}"
             _logger.info(message)
@@ -617,11 +610,21 @@ class BrevoSyncService:
             }
             
         except Exception as e:
-            _logger.error(f"List sync failed: {str(e)}")
-            self.config.sync_status = 'error'
-            self.config.error_message = str(e)
+            _logger.error("List sync failed: %s", e)
             return {'success': False, 'error': str(e)}
     
+    def _fetch_per_partner(self, partners, fetch):
+        """Yield (partner, result) pairs, calling the Brevo getter for a whole batch of partners concurrently.
+
+        Only the HTTP calls run in worker threads; the caller handles each result in the current
+        thread, since the ORM environment must not be shared between threads.
+        """
+        batch_size = self.config.batch_size or 100
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+            for start in range(0, len(partners), batch_size):
+                batch = partners[start:start + batch_size]
+                yield from zip(batch, executor.map(fetch, batch.mapped('brevo_id')))
+
     def sync_tags(self) -> Dict[str, Any]:
         """Synchronize tags between Brevo and Odoo"""
         try:
@@ -634,11 +637,9 @@ class BrevoSyncService:
             synced_count = 0
             error_count = 0
             
-            for partner in partners:
+            # Get tags from Brevo
+            for partner, brevo_tags_result in self._fetch_per_partner(partners, self.brevo_service.get_contact_tags):
                 try:
-                    # Get tags from Brevo
-                    brevo_tags_result = self.brevo_service.get_contact_tags(partner.brevo_id)
-                    
                     if not brevo_tags_result.get('success'):
                         error_count += 1
                         continue
@@ -669,7 +670,7 @@ class BrevoSyncService:
                     synced_count += 1
                     
                 except Exception as e:
-                    _logger.error(f"Failed to sync tags for partner {partner.id}: {str(e)}")
+                    _logger.error("Failed to sync tags for partner %s: %s", partner.id, e)
                     error_count += 1
                     continue
             
@@ -679,7 +680,7 @@ class BrevoSyncService:
             }
             
         except Exception as e:
-            _logger.error(f"Tag sync failed: {str(e)}")
+            _logger.error("Tag sync failed: %s", e)
             return {'success': False, 'error': str(e)}
     
     def sync_dynamic_fields(self) -> Dict[str, Any]:
@@ -703,35 +704,29 @@ class BrevoSyncService:
             synced_count = 0
             error_count = 0
             
-            for partner in partners:
+            # Get contact data from Brevo
+            for partner, contact_result in self._fetch_per_partner(partners, self.brevo_service.get_contact):
                 try:
-                    # Get contact data from Brevo
-                    contact_result = self.brevo_service.get_contact(partner.brevo_id)
-                    
                     if not contact_result.get('success'):
                         error_count += 1
                         continue
                     
                     contact_data = contact_result.get('contact', {})
                     
-                    # Apply field mappings
+                    # Collect the mapped values, then set them on the partner at once
+                    mapping_to_value = {}
                     for mapping in field_mappings:
                         try:
-                            # Get value from Brevo
-                            value = mapping.get_field_value_from_brevo(contact_data)
-                            
-                            if value is not None:
-                                # Set value in Odoo
-                                mapping.set_field_value_in_odoo(partner, value)
-                        
+                            mapping_to_value[mapping] = mapping.get_field_value_from_brevo(contact_data)
                         except Exception as e:
-                            _logger.error(f"Failed to map field {mapping.brevo_field_name} for partner {partner.id}: {str(e)}")
+                            _logger.error("Failed to map field %s for partner %s: %s", mapping.brevo_field_name, partner.id, e)
                             continue
+                    field_mappings._apply_values(partner, mapping_to_value)
                     
                     synced_count += 1
                     
                 except Exception as e:
-                    _logger.error(f"Failed to sync dynamic fields for partner {partner.id}: {str(e)}")
+                    _logger.error("Failed to sync dynamic fields for partner %s: %s", partner.id, e)
                     error_count += 1
                     continue
             
@@ -741,7 +736,7 @@ class BrevoSyncService:
             }
             
         except Exception as e:
-            _logger.error(f"Dynamic fields sync failed: {str(e)}")
+            _logger.error("Dynamic fields sync failed: %s", e)
             return {'success': False, 'error': str(e)}
     
     def discover_brevo_attributes(self) -> Dict[str, Any]:
@@ -794,7 +789,7 @@ class BrevoSyncService:
             }
             
         except Exception as e:
-            _logger.error(f"Attribute discovery failed: {str(e)}")
+            _logger.error("Attribute discovery failed: %s", e)
             return {'success': False, 'error': str(e)}
     
     def _map_brevo_type_to_odoo(self, brevo_type: str) -> str:
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from . import test_brevo_field_mapping
+from . import test_brevo_webhook_inbox
+from . import test_brevo_webhook_controller
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestBrevoFieldMapping(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.country = cls.env.ref('base.be')
+        cls.partner = cls.env['res.partner'].create({
+            'name': 'Brevo Test Partner',
+            'country_id': cls.country.id,
+        })
+        Mapping = cls.env['brevo.field.mapping']
+        cls.country_mapping = Mapping.create({
+            'name': 'COUNTRY -> country_id',
+            'brevo_field_name': 'COUNTRY',
+            'odoo_field_name': 'country_id',
+            'field_type': 'many2one',
+        })
+        cls.city_mapping = Mapping.create({
+            'name': 'CITY -> city',
+            'brevo_field_name': 'CITY',
+            'odoo_field_name': 'city',
+            'field_type': 'char',
+        })
+        cls.dynamic_mapping = Mapping.create({
+            'name': 'HOBBY -> brevo_test_hobby',
+            'brevo_field_name': 'HOBBY',
+            'odoo_field_name': 'brevo_test_hobby',
+            'field_type': 'char',
+        })
+
+    def test_apply_values_skips_rejected_value(self):
+        """A raw Brevo string for a many2one does not block the other mapped fields"""
+        self.env['brevo.field.mapping']._apply_values(self.partner, {
+            self.country_mapping: 'France',
+            self.city_mapping: 'Paris',
+            self.dynamic_mapping: 'Chess',
+        })
+        self.partner.flush_recordset()
+        self.assertEqual(self.partner.country_id, self.country)
+        self.assertEqual(self.partner.city, 'Paris')
+        self.assertEqual(self.partner.brevo_dynamic_fields, {'brevo_test_hobby': 'Chess'})
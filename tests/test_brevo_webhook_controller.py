@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import hmac
+import json
+import time
+
+from odoo.tests import HttpCase, tagged
+from odoo.tools import mute_logger
+
+from ..controllers.brevo_webhook import SIGNATURE_TOLERANCE
+
+WEBHOOK_SECRET = 'brevo-test-secret'
+
+
+@tagged('post_install', '-at_install')
+class TestBrevoWebhookController(HttpCase):
+
+    def setUp(self):
+        super().setUp()
+        ICP = self.env['ir.config_parameter'].sudo()
+        ICP.set_param('brevo.webhook_require_signature', '1')
+        ICP.set_param('brevo.webhook_secret', WEBHOOK_SECRET)
+        self.Inbox = self.env['brevo.webhook.inbox']
+
+    def _sign(self, body, timestamp=None):
+        timestamp = str(int(time.time()) if timestamp is None else timestamp)
+        digest = hmac.new(WEBHOOK_SECRET.encode(), timestamp.encode() + b'.' + body, hashlib.sha256).hexdigest()
+        return f't={timestamp},v1={digest}'
+
+    def _post(self, body, signature):
+        return self.url_open('/brevo/webhook', data=body, headers={
+            'Content-Type': 'application/json',
+            'X-Brevo-Signature': signature,
+        })
+
+    def _inbox_count(self):
+        return self.Inbox.search_count([])
+
+    def test_valid_signature_queues_raw_body(self):
+        """A signed delivery is parsed and stored as received"""
+        body = json.dumps({'event': 'contact.updated', 'data': {'id': 42}}).encode()
+        response = self._post(body, self._sign(body))
+        self.assertEqual(response.status_code, 200)
+        record = self.Inbox.search([], order='id desc', limit=1)
+        self.assertEqual(record.raw_body, body.decode())
+        self.assertEqual(record.event_type, 'contact.updated')
+        self.assertEqual(record.channel, 'contact')
+        self.assertEqual(record.state, 'pending')
+
+    def test_invalid_signature_rejected(self):
+        """A delivery signed with another secret is not queued"""
+        body = json.dumps({'event': 'contact.updated', 'data': {'id': 42}}).encode()
+        count = self._inbox_count()
+        signature = self._sign(body).rsplit('=', 1)[0] + '=' + '0' * 64
+        response = self._post(body, signature)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._inbox_count(), count)
+
+    def test_stale_signature_rejected(self):
+        """A correctly signed delivery outside the replay window is not queued"""
+        body = json.dumps({'event': 'contact.updated', 'data': {'id': 42}}).encode()
+        count = self._inbox_count()
+        response = self._post(body, self._sign(body, int(time.time()) - SIGNATURE_TOLERANCE - 60))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._inbox_count(), count)
+
+    @mute_logger('odoo.addons.brevo_connector.controllers.brevo_webhook')
+    def test_invalid_json_rejected(self):
+        """A signed body that is not JSON is rejected"""
+        body = b'{not json'
+        count = self._inbox_count()
+        response = self._post(body, self._sign(body))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self._inbox_count(), count)
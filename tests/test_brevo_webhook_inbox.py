@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+import json
+from unittest.mock import patch
+
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import mute_logger
+
+
+@tagged('post_install', '-at_install')
+class TestBrevoWebhookInbox(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Inbox = cls.env['brevo.webhook.inbox']
+
+    def _enqueue(self, event_type, data):
+        return self.Inbox.enqueue(json.dumps({'event': event_type, 'data': data}), event_type=event_type)
+
+    @mute_logger('odoo.sql_db', 'odoo.addons.brevo_connector.models.brevo_webhook_inbox')
+    def test_failing_write_rolls_back_only_its_event(self):
+        """A handler write rejected by the database at flush does not affect the next event"""
+        partner = self.env['res.partner'].create({'name': 'Webhook Partner'})
+        first = self._enqueue('contact.updated', {'id': 1})
+        second = self._enqueue('contact.updated', {'id': 2})
+
+        def process_webhook(inbox, webhook_data, partners=None):
+            if webhook_data['data']['id'] == 1:
+                # Violates res_partner_check_name, which only fails when the write is flushed
+                partner.write({'name': False})
+            else:
+                partner.write({'city': 'Paris'})
+            return {'success': True, 'message': 'Partner updated'}
+
+        with patch.object(type(self.Inbox), '_process_webhook', process_webhook):
+            self.Inbox._cron_process_inbox('contact')
+
+        self.assertEqual(first.state, 'error')
+        self.assertEqual(second.state, 'done')
+        self.assertEqual(partner.name, 'Webhook Partner')
+        self.assertEqual(partner.city, 'Paris')
+
+    def test_enqueue_routes_channel(self):
+        """Contact and list events go to the contact channel, bookings to their own"""
+        contact = self._enqueue('contact.updated', {'id': 1})
+        booking = self._enqueue('meeting.created', {'id': 2})
+        self.assertEqual(contact.channel, 'contact')
+        self.assertEqual(booking.channel, 'booking')
+        self.assertEqual((contact | booking).mapped('state'), ['pending', 'pending'])
+
+    def test_process_contact_update(self):
+        """A contact webhook updates the partner linked by Brevo ID"""
+        partner = self.env['res.partner'].create({'name': 'Inbox Partner', 'brevo_id': '42'})
+        record = self._enqueue('contact.updated', {'id': 42, 'attributes': {'CITY': 'Lyon'}})
+        self.Inbox._cron_process_inbox('contact')
+        self.assertEqual(record.state, 'done')
+        self.assertEqual(partner.city, 'Lyon')
+        self.assertEqual(partner.brevo_sync_status, 'synced')
+
+    @mute_logger('odoo.addons.brevo_connector.models.brevo_webhook_inbox')
+    def test_undecodable_body_marks_error(self):
+        """A body that is not JSON is marked as failed instead of blocking the batch"""
+        broken = self.Inbox.enqueue('{not json', event_type='contact.updated')
+        valid = self._enqueue('contact.deleted', {'id': 404})
+        self.Inbox._cron_process_inbox('contact')
+        self.assertEqual(broken.state, 'error')
+        self.assertEqual(valid.state, 'done')
+
+    def test_failing_handler_does_not_affect_next_event(self):
+        """The writes of a handler reporting a failure are rolled back; the next event still applies"""
+        partner = self.env['res.partner'].create({'name': 'Webhook Partner'})
+        first = self._enqueue('contact.updated', {'id': 1})
+        second = self._enqueue('contact.updated', {'id': 2})
+
+        def process_webhook(inbox, webhook_data, partners=None):
+            if webhook_data['data']['id'] == 1:
+                partner.write({'city': 'Rolled Back'})
+                return {'success': False, 'error': 'Handler failed'}
+            partner.write({'zip': '75001'})
+            return {'success': True, 'message': 'Partner updated'}
+
+        with patch.object(type(self.Inbox), '_process_webhook', process_webhook):
+            self.Inbox._cron_process_inbox('contact')
+
+        self.assertEqual(first.state, 'error')
+        self.assertEqual(first.result_message, 'Handler failed')
+        self.assertEqual(second.state, 'done')
+        self.assertFalse(partner.city)
+        self.assertEqual(partner.zip, '75001')
+
+    def test_duplicate_booking_processed_once(self):
+        """A redelivered booking.created event does not create a second lead"""
+        calls = []
+
+        def handle_booking_created(inbox, event_data):
+            calls.append(event_data['id'])
+            return {'success': True, 'message': 'Lead created'}
+
+        first = self._enqueue('booking.created', {'id': 'booking-7'})
+        retry = self._enqueue('booking.created', {'id': 'booking-7'})
+        with patch.object(type(self.Inbox), '_handle_booking_created', handle_booking_created):
+            self.Inbox._cron_process_inbox('booking')
+
+        self.assertEqual(calls, ['booking-7'])
+        self.assertEqual((first | retry).mapped('state'), ['done', 'done'])
+        self.assertIn('Duplicate delivery ignored', retry.result_message)
+
+    def test_dedup_claim(self):
+        """An event key can only be claimed once"""
+        Dedup = self.env['brevo.webhook.dedup']
+        self.assertTrue(Dedup._claim('booking.created:1'))
+        self.assertFalse(Dedup._claim('booking.created:1'))
+        self.assertTrue(Dedup._claim('booking.created:2'))
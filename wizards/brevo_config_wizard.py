@@ -4,6 +4,8 @@ import logging
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError, UserError
 
+from ..services.brevo_service import get_brevo_service
+
 _logger = logging.getLogger(__name__)
 
 
@@ -108,8 +110,7 @@ class BrevoConfigWizard(models.TransientModel):
     def test_connection(self):
         """Test the Brevo API connection"""
         try:
-            from ..services.brevo_service import BrevoService
-            service = BrevoService(self.api_key)
+            service = get_brevo_service(self.api_key)
             result = service.test_connection()
             
             if result.get('success'):
@@ -149,7 +150,7 @@ Please check your API key and try again."""
                     }
                 }
         except Exception as e:
-            _logger.error(f"Brevo connection test failed: {str(e)}")
+            _logger.error("Brevo connection test failed: %s", e)
             self.connection_success = False
             self.connection_test_result = f"""Connection Failed!
 
@@ -172,9 +173,7 @@ Please check your API key and try again."""
         try:
             if not self.connection_success:
                 raise UserError(_('Please test the connection first before setting up webhooks'))
-            
-            from ..services.brevo_service import BrevoService
-            service = BrevoService(self.api_key)
+            service = get_brevo_service(self.api_key)
             
             # Get webhook URL
             base_url = self.env['ir.config_parameter'].sudo().get_param('web.base.url')
@@ -231,7 +230,7 @@ Please check your API key and try again."""
                     }
                 }
         except Exception as e:
-            _logger.error(f"Webhook setup failed: {str(e)}")
+            _logger.error("Webhook setup failed: %s", e)
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
@@ -295,7 +294,7 @@ Please check your API key and try again."""
             }
             
         except Exception as e:
-            _logger.error(f"Configuration application failed: {str(e)}")
+            _logger.error("Configuration application failed: %s", e)
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
@@ -325,7 +324,7 @@ Please check your API key and try again."""
             return result
             
         except Exception as e:
-            _logger.error(f"Manual contact sync failed: {str(e)}")
+            _logger.error("Manual contact sync failed: %s", e)
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
@@ -355,7 +354,7 @@ Please check your API key and try again."""
             return result
             
         except Exception as e:
-            _logger.error(f"Manual lists sync failed: {str(e)}")
+            _logger.error("Manual lists sync failed: %s", e)
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
@@ -4,6 +4,8 @@ import logging
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
 
+from ..services.brevo_sync_service import BrevoSyncService
+
 _logger = logging.getLogger(__name__)
 
 
@@ -70,7 +72,7 @@ class BrevoDeleteConfirmationWizard(models.TransientModel):
             }
             
         except Exception as e:
-            _logger.error(f"Failed to delete partners: {str(e)}")
+            _logger.error("Failed to delete partners: %s", e)
             raise ValidationError(_('Failed to delete partners: %s') % str(e))
 
     def action_cancel(self):
@@ -80,7 +82,6 @@ class BrevoDeleteConfirmationWizard(models.TransientModel):
     def _delete_from_brevo(self):
         """Delete contacts from Brevo"""
         try:
-            from ..services.brevo_sync_service import BrevoSyncService
             config = self.env['brevo.config'].get_active_config()
             
             if not config:
@@ -94,12 +95,12 @@ class BrevoDeleteConfirmationWizard(models.TransientModel):
                     try:
                         result = sync_service.brevo_service.delete_contact(partner.brevo_id)
                         if result.get('success'):
-                            _logger.info(f"Deleted contact {partner.email} from Brevo")
+                            _logger.info("Deleted contact %s from Brevo", partner.email)
                         else:
-                            _logger.warning(f"Failed to delete contact {partner.email} from Brevo: {result.get('error')}")
+                            _logger.warning("Failed to delete contact %s from Brevo: %s", partner.email, result.get('error'))
                     except Exception as e:
-                        _logger.error(f"Failed to delete contact {partner.email} from Brevo: {str(e)}")
+                        _logger.error("Failed to delete contact %s from Brevo: %s", partner.email, e)
                         
         except Exception as e:
-            _logger.error(f"Failed to delete contacts from Brevo: {str(e)}")
+            _logger.error("Failed to delete contacts from Brevo: %s", e)
             raise e